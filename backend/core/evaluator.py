@@ -1,5 +1,9 @@
 from __future__ import annotations
+from functools import lru_cache
+from types import CodeType
 from typing import List, Dict, Any
+import ast
+import numpy as np
 import pandas as pd
 import re
 import builtins
@@ -111,7 +115,7 @@ def _replace_null_predicates(expr: str) -> str:
     return "".join(result)
 
 
-def _cond_eval(cond: str, env: Dict[str, Any]) -> bool:
+def _cond_to_python(cond: str) -> str:
     py = cond
     py = re.sub(r"\bAND\b", "and", py, flags=re.IGNORECASE)
     py = re.sub(r"\bOR\b", "or", py, flags=re.IGNORECASE)
@@ -120,25 +124,241 @@ def _cond_eval(cond: str, env: Dict[str, Any]) -> bool:
     py = py.replace("<>", "!=")
     # Only convert standalone equality operators; avoid touching >=, <=, !=, ==.
     py = re.sub(r"(?<![<>=!])=(?!=)", "==", py)
+    return _replace_identifiers(py)
 
-    env_ci = {str(k).lower(): v for k, v in env.items()}
-    py = _replace_identifiers(py)
+
+@lru_cache(maxsize=256)
+def _compile_cond(cond: str) -> tuple[str, CodeType | None]:
+    # Predicates are evaluated once per row; translate and compile them once.
+    py = _cond_to_python(cond)
+    try:
+        return py, compile(py, "<condition>", "eval")
+    except SyntaxError:
+        return py, None
+
+
+def _cond_scope(env: Any) -> Dict[str, Any]:
+    return {"env": env, "is_null": _is_null, "is_not_null": _is_not_null}
+
+
+def _cond_eval_in(cond: str, scope: Dict[str, Any]) -> bool:
+    py, code = _compile_cond(cond)
     try:
         return bool(
-            builtins.eval(
-                py,
-                {"__builtins__": {}},
-                {"env": env_ci, "is_null": _is_null, "is_not_null": _is_not_null},
-            )
+            builtins.eval(code if code is not None else py, {"__builtins__": {}}, scope)
         )
     except Exception as e:
         print(f"Error evaluating condition: {e}")
         print(f"Condition: {cond}")
-        print(f"Environment: {env}")
+        print(f"Environment: {scope['env']}")
         print(f"Python code: {py}")
         return False
 
 
+class _SlotEnv:
+    """``env`` for the row loop: resolves names against the current row tuple,
+    so no per-row dict is built."""
+
+    __slots__ = ("slots", "values")
+
+    def __init__(self, slots: Dict[str, int]):
+        self.slots = slots
+        self.values: tuple = ()
+
+    def get(self, key: str) -> Any:
+        i = self.slots.get(key)
+        return None if i is None else self.values[i]
+
+    def __repr__(self) -> str:
+        return repr({key: self.values[i] for key, i in self.slots.items()})
+
+
+class _Unvectorizable(Exception):
+    """Raised when a predicate has no column-wise equivalent."""
+
+
+class _MaskBuilder(ast.NodeTransformer):
+    """Rewrite a translated predicate so it evaluates over whole columns.
+
+    ``and``/``or``/``not`` become element-wise helpers and chained comparisons
+    are split into pairs. Anything outside comparisons, null checks, column
+    lookups, literals and simple arithmetic is rejected so the caller can fall
+    back to the row-by-row path with its exact semantics.
+    """
+
+    _BOOL_CALLS = ("is_null", "is_not_null")
+    _ARITH_OPS = (ast.Add, ast.Sub, ast.Mult)
+    _CMP_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+    def build(self, tree: ast.Expression) -> ast.Expression:
+        if not self._is_boolean(tree.body):
+            raise _Unvectorizable()
+        return ast.fix_missing_locations(self.visit(tree))
+
+    def _is_boolean(self, node: ast.AST) -> bool:
+        if isinstance(node, (ast.BoolOp, ast.Compare)):
+            return True
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return True
+        if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+            return True
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in self._BOOL_CALLS
+        )
+
+    def _call(self, name: str, args: List[ast.AST]) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def visit_Expression(self, node: ast.Expression) -> ast.Expression:
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        if not all(self._is_boolean(v) for v in node.values):
+            raise _Unvectorizable()
+        helper = "_and" if isinstance(node.op, ast.And) else "_or"
+        values = [self.visit(v) for v in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = self._call(helper, [result, value])
+        return result
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if isinstance(node.op, ast.Not):
+            if not self._is_boolean(node.operand):
+                raise _Unvectorizable()
+            return self._call("_not", [self.visit(node.operand)])
+        if isinstance(node.op, (ast.USub, ast.UAdd)):
+            node.operand = self.visit(node.operand)
+            return node
+        raise _Unvectorizable()
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        if not all(isinstance(op, self._CMP_OPS) for op in node.ops):
+            raise _Unvectorizable()
+        operands = [self.visit(node.left)] + [self.visit(c) for c in node.comparators]
+        pairs = [
+            ast.Compare(left=operands[i], ops=[op], comparators=[operands[i + 1]])
+            for i, op in enumerate(node.ops)
+        ]
+        result: ast.AST = pairs[0]
+        for pair in pairs[1:]:
+            result = self._call("_and", [result, pair])
+        return result
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if not isinstance(node.op, self._ARITH_OPS):
+            raise _Unvectorizable()
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        func = node.func
+        if node.keywords or len(node.args) != 1:
+            raise _Unvectorizable()
+        if isinstance(func, ast.Name) and func.id in self._BOOL_CALLS:
+            node.args = [self.visit(node.args[0])]
+            return node
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr == "get"
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "env"
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            return node
+        raise _Unvectorizable()
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        raise _Unvectorizable()
+
+
+class _ColumnEnv(dict):
+    def get(self, key):  # type: ignore[override]
+        # Unknown identifiers evaluate to None row-wise; leave those to the
+        # row path instead of guessing a column-wise equivalent.
+        if key not in self:
+            raise _Unvectorizable()
+        return self[key]
+
+
+def _vec_and(a: Any, b: Any) -> Any:
+    return a & b
+
+
+def _vec_or(a: Any, b: Any) -> Any:
+    return a | b
+
+
+def _vec_not(a: Any) -> Any:
+    return ~a if isinstance(a, pd.Series) else not a
+
+
+def _column_env(df: pd.DataFrame, aliases: Dict[str, List[str]]) -> _ColumnEnv:
+    # Mirrors _row_slots, with whole columns in place of row positions.
+    env = _ColumnEnv()
+    for col in df.columns:
+        if col == "_prov":
+            continue
+        env[col.lower()] = df[col]
+    for alias, cols in (aliases or {}).items():
+        alias_l = alias.lower()
+        for col in cols:
+            col_l = col.lower()
+            if col in df.columns:
+                env[f"{alias_l}.{col_l}"] = df[col]
+                if col_l.endswith("_r"):
+                    env[f"{alias_l}.{col_l[:-2]}"] = df[col]
+    return env
+
+
+@lru_cache(maxsize=256)
+def _compile_mask(cond: str) -> CodeType | None:
+    try:
+        tree = _MaskBuilder().build(ast.parse(_compile_cond(cond)[0], mode="eval"))
+    except (SyntaxError, _Unvectorizable):
+        return None
+    return compile(tree, "<condition>", "eval")
+
+
+def _cond_mask(
+    cond: str, df: pd.DataFrame, aliases: Dict[str, List[str]]
+) -> pd.Series | None:
+    """Evaluate ``cond`` over all rows at once, or return None if it cannot be."""
+
+    code = _compile_mask(cond)
+    if code is None:
+        return None
+    try:
+        mask = builtins.eval(
+            code,
+            {"__builtins__": {}},
+            {
+                "env": _column_env(df, aliases),
+                "is_null": pd.isna,
+                "is_not_null": pd.notna,
+                "_and": _vec_and,
+                "_or": _vec_or,
+                "_not": _vec_not,
+            },
+        )
+    except Exception:
+        return None
+    if isinstance(mask, pd.Series):
+        if mask.dtype != bool or len(mask) != len(df):
+            return None
+        return mask
+    if isinstance(mask, (bool, np.bool_)):
+        return pd.Series(bool(mask), index=df.index, dtype=bool)
+    return None
+
+
 def _filter_aliases(aliases: Dict[str, List[str]], columns: List[str]) -> Dict[str, List[str]]:
     col_set = set(columns)
     return {
@@ -176,23 +396,27 @@ def _combine_aliases(
     return aliases
 
 
-def _row_env(row: pd.Series, aliases: Dict[str, List[str]]) -> Dict[str, Any]:
-    env: Dict[str, Any] = {}
-    for col in row.index:
+def _row_slots(columns: List[str], aliases: Dict[str, List[str]]) -> Dict[str, int]:
+    """Map each name a condition may reference to the tuple position holding
+    its value: bare column names, plus ``alias.column`` for every alias."""
+
+    positions = {col: i for i, col in enumerate(columns)}
+    slots: Dict[str, int] = {}
+    for col in columns:
         if col == "_prov":
             continue
-        env[col.lower()] = row[col]
+        slots[col.lower()] = positions[col]
     for alias, cols in (aliases or {}).items():
         alias_l = alias.lower()
         for col in cols:
             col_l = col.lower()
-            if col in row.index:
-                env[f"{alias_l}.{col_l}"] = row[col]
+            if col in positions:
+                slots[f"{alias_l}.{col_l}"] = positions[col]
                 # Product/join suffixes colliding right-side columns with "_r".
                 # Alias-qualified references should still use the logical base name.
                 if col_l.endswith("_r"):
-                    env[f"{alias_l}.{col_l[:-2]}"] = row[col]
-    return env
+                    slots[f"{alias_l}.{col_l[:-2]}"] = positions[col]
+    return slots
 
 
 def _resolve_projection_attrs(
@@ -258,18 +482,28 @@ def _resolve_rename_source(
     return match
 
 
+_THETA_MORSEL_ROWS = 1_000_000
+
+
 def _product(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
-    L = L.copy()
-    R = R.copy()
-    left_aliases = L.attrs.get("aliases", {})
-    right_aliases = R.attrs.get("aliases", {})
-    L["_k"] = 1
-    R["_k"] = 1
-    M = L.merge(R, on="_k", how="inner", suffixes=("", "_r"))
-    if "_k" in M.columns:
-        M = M.drop(columns=["_k"])
-    L.drop(columns=["_k"], inplace=True)
-    R.drop(columns=["_k"], inplace=True)
+    # A cross merge needs no helper key column, so neither input is copied
+    # just to add one.
+    M = L.merge(R, how="cross", suffixes=("", "_r"))
+    return _finish_pairing(M, L, R)
+
+
+def _paired_product(
+    L: pd.DataFrame, R: pd.DataFrame, left_pos: np.ndarray, right_pos: np.ndarray
+) -> pd.DataFrame:
+    """Rows ``L[left_pos[i]]`` + ``R[right_pos[i]]``, laid out like ``_product``."""
+
+    left = L.iloc[left_pos].reset_index(drop=True)
+    right = R.iloc[right_pos].reset_index(drop=True)
+    M = left.merge(right, left_index=True, right_index=True, suffixes=("", "_r"))
+    return _finish_pairing(M, L, R)
+
+
+def _finish_pairing(M: pd.DataFrame, L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
     if "_prov_x" in M.columns:
         M["_prov"] = M["_prov_x"] + M["_prov_y"]
         M = M.drop(
@@ -279,7 +513,7 @@ def _product(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
         M["_prov"] = M["_prov"] + M["_prov_r"]
         M = M.drop(columns=["_prov_r"])
     M.attrs["aliases"] = _combine_aliases(
-        list(M.columns), left_aliases, right_aliases
+        list(M.columns), L.attrs.get("aliases", {}), R.attrs.get("aliases", {})
     )
     return M
 
@@ -305,14 +539,184 @@ def _natural_join(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
     return M
 
 
+def _equi_join_keys(L: pd.DataFrame, R: pd.DataFrame, cond: str) -> List[tuple[str, str]]:
+    """Return (left column, right column) pairs equated by top-level ANDs in ``cond``."""
+
+    try:
+        body = ast.parse(_compile_cond(cond)[0], mode="eval").body
+    except SyntaxError:
+        return []
+    if isinstance(body, ast.BoolOp) and isinstance(body.op, ast.And):
+        conjuncts = body.values
+    else:
+        conjuncts = [body]
+
+    # Resolve identifiers exactly as the predicate would see them on the product.
+    shape = _product(L.head(0), R.head(0))
+    columns = _column_env(shape, shape.attrs.get("aliases", {}))
+    left_cols = {c: c for c in L.columns if c != "_prov"}
+    right_cols = {
+        (f"{c}_r" if c in L.columns else c): c for c in R.columns if c != "_prov"
+    }
+
+    def _side(node: ast.AST) -> tuple[str, str] | None:
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "env"
+            and len(node.args) == 1
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            return None
+        name = node.args[0].value
+        if name not in columns:
+            return None
+        label = columns[name].name
+        if label in left_cols and label not in right_cols:
+            return "L", left_cols[label]
+        if label in right_cols and label not in left_cols:
+            return "R", right_cols[label]
+        return None
+
+    keys: List[tuple[str, str]] = []
+    for node in conjuncts:
+        if not (
+            isinstance(node, ast.Compare)
+            and len(node.ops) == 1
+            and isinstance(node.ops[0], ast.Eq)
+        ):
+            continue
+        a, b = _side(node.left), _side(node.comparators[0])
+        if a and b and a[0] != b[0]:
+            left, right = (a, b) if a[0] == "L" else (b, a)
+            keys.append((left[1], right[1]))
+    return keys
+
+
+def _equi_join_candidates(
+    L: pd.DataFrame, R: pd.DataFrame, keys: List[tuple[str, str]]
+) -> pd.DataFrame | None:
+    """Hash-join ``L`` and ``R`` on ``keys``, laid out like their product.
+
+    Rows come back in product order. The result may contain pairs the full
+    predicate rejects (e.g. NULL keys), so callers still apply it.
+    """
+
+    names = [f"k{i}" for i in range(len(keys))]
+    left = pd.DataFrame({n: L[lc].to_numpy() for n, (lc, _) in zip(names, keys)})
+    right = pd.DataFrame({n: R[rc].to_numpy() for n, (_, rc) in zip(names, keys)})
+    left["_l"] = np.arange(len(L))
+    right["_r"] = np.arange(len(R))
+    try:
+        pairs = left.merge(right, on=names, how="inner")
+    except (TypeError, ValueError):
+        return None
+    pairs = pairs.sort_values(["_l", "_r"], kind="stable")
+    return _paired_product(L, R, pairs["_l"].to_numpy(), pairs["_r"].to_numpy())
+
+
 def _theta_join(L: pd.DataFrame, R: pd.DataFrame, cond: str) -> pd.DataFrame:
-    P = _product(L, R)
+    keys = _equi_join_keys(L, R, cond)
+    if keys:
+        P = _equi_join_candidates(L, R, keys)
+        if P is not None:
+            return _filter_rows(P, cond, P.attrs.get("aliases", {}))
+    # Without hash keys every pair is a candidate. Filter the product one
+    # block of left rows at a time so at most about _THETA_MORSEL_ROWS pairs
+    # are materialized at once.
+    step = max(1, _THETA_MORSEL_ROWS // max(len(R), 1))
+    parts = []
+    for start in range(0, max(len(L), 1), step):
+        P = _product(L.iloc[start : start + step], R)
+        parts.append(_filter_rows(P, cond, P.attrs.get("aliases", {})))
+    if len(parts) == 1:
+        return parts[0]
+    aliases = parts[0].attrs.get("aliases", {})
+    out = pd.concat([p for p in parts if len(p)] or parts[:1], ignore_index=True)
+    out.attrs["aliases"] = aliases
+    return out
+
+
+def _filter_rows(df: pd.DataFrame, cond: str, aliases: Dict[str, List[str]]) -> pd.DataFrame:
+    mask = _cond_mask(cond, df, aliases)
+    if mask is not None:
+        return df[mask.to_numpy()].reset_index(drop=True)
+    env = _SlotEnv(_row_slots(list(df.columns), aliases))
+    scope = _cond_scope(env)
     keeps = []
-    aliases = P.attrs.get("aliases", {})
-    for i, row in P.iterrows():
-        if _cond_eval(cond, _row_env(row, aliases)):
-            keeps.append(i)
-    return P.loc[keeps].reset_index(drop=True)
+    for pos, values in enumerate(df.itertuples(index=False, name=None)):
+        env.values = values
+        if _cond_eval_in(cond, scope):
+            keeps.append(pos)
+    return df.iloc[keeps].reset_index(drop=True)
+
+
+def _project_distinct(df: pd.DataFrame, attrs: List[str]) -> pd.DataFrame:
+    """Keep the first row of each distinct ``attrs`` combination, with the
+    provenance of all of its duplicates concatenated in row order."""
+    keys = list(dict.fromkeys(attrs))
+    codes = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    first = ~pd.Series(codes).duplicated().to_numpy()
+    out = df[attrs + ["_prov"]].iloc[first].reset_index(drop=True)
+    if len(out) < len(df):
+        merged: List[List[Any]] = [[] for _ in range(len(out))]
+        for code, prov in zip(codes, df["_prov"]):
+            merged[code].extend(prov)
+        out["_prov"] = merged
+    return out
+
+
+def _row_hashes(df: pd.DataFrame) -> pd.Series | None:
+    """One uint64 per row, or None when hashing could disagree with ``==``.
+
+    Object columns hash through str(), which would conflate 1 and "1".
+    """
+    if any(dtype == object for dtype in df.dtypes):
+        return None
+    # -0.0 and 0.0 compare equal but hash differently.
+    floats = df.select_dtypes("float")
+    if len(floats.columns):
+        df = df.assign(**{c: floats[c] + 0.0 for c in floats.columns})
+    return pd.util.hash_pandas_object(df, index=False)
+
+
+def _union(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
+    schema = _schema(L)
+    tmp = pd.concat([L[schema + ["_prov"]], R[schema + ["_prov"]]], ignore_index=True)
+    keys = _row_hashes(tmp[schema])
+    if keys is None:
+        return tmp.drop_duplicates(subset=schema).reset_index(drop=True)
+    # Equal rows always share a hash, so only rows whose hash repeats can be
+    # duplicates; confirm those by value so a collision never drops a row.
+    shared = keys.duplicated(keep=False).to_numpy()
+    duplicate = np.zeros(len(tmp), dtype=bool)
+    duplicate[shared] = tmp.loc[shared, schema].duplicated().to_numpy()
+    return tmp[~duplicate].reset_index(drop=True)
+
+
+def _difference(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
+    schema = _schema(L)
+    left, right = L[schema], R[schema]
+    # Row hashes only agree across frames when the column dtypes do.
+    same_dtypes = all(left[c].dtype == right[c].dtype for c in schema)
+    left_keys = _row_hashes(left) if same_dtypes else None
+    right_keys = _row_hashes(right) if left_keys is not None else None
+    if right_keys is None:
+        return L[~_rows_in(left, right)].reset_index(drop=True)
+    hit = left_keys.isin(right_keys).to_numpy(copy=True)
+    if hit.any():
+        # A hash hit is only a candidate: confirm it by value so a 64-bit
+        # collision cannot drop a row that R does not contain.
+        candidates = right[right_keys.isin(left_keys[hit]).to_numpy()]
+        hit[hit] = _rows_in(left[hit], candidates)
+    return L[~hit].reset_index(drop=True)
+
+
+def _rows_in(left: pd.DataFrame, right: pd.DataFrame) -> np.ndarray:
+    """Mask of the rows of ``left`` that also occur in ``right``, by value."""
+    merged = left.merge(right.drop_duplicates(), on=list(left.columns), how="left", indicator=True)
+    return (merged["_merge"] == "both").to_numpy()
 
 
 def _intersection(L: pd.DataFrame, R: pd.DataFrame) -> pd.DataFrame:
@@ -395,7 +799,9 @@ def eval(
             raise KeyError(
                 f"Relation '{node.name}' not found. Available relations: {available}"
             )
-        df = env[key].copy()
+        # Operators never modify their inputs, so env frames are shared; the
+        # shallow copy only gives this node its own attrs.
+        df = env[key].copy(deep=False)
         df.attrs["aliases"] = {node.name.lower(): _schema(df)}
         steps.append(
             {
@@ -411,12 +817,7 @@ def eval(
         inp = eval(node.sub, env, steps)
         aliases = inp.attrs.get("aliases", {})
         resolved_attrs = _resolve_projection_attrs(node.attrs, list(inp.columns), aliases)
-        out = (
-            inp[resolved_attrs + ["_prov"]]
-            .copy()
-            .drop_duplicates(subset=resolved_attrs)
-            .reset_index(drop=True)
-        )
+        out = _project_distinct(inp, resolved_attrs)
         out.attrs["aliases"] = _filter_aliases(aliases, out.columns)
         steps.append(
             {
@@ -435,13 +836,8 @@ def eval(
         return out
     if isinstance(node, AST.Selection):
         inp = eval(node.sub, env, steps)
-        vis = [c for c in inp.columns if c != "_prov"]
         aliases = inp.attrs.get("aliases", {})
-        keeps = []
-        for i, row in inp.iterrows():
-            if _cond_eval(node.cond, _row_env(row, aliases)):
-                keeps.append(i)
-        out = inp.loc[keeps].reset_index(drop=True)
+        out = _filter_rows(inp, node.cond, aliases)
         out.attrs["aliases"] = _filter_aliases(aliases, out.columns)
         steps.append(
             {
@@ -483,7 +879,7 @@ def eval(
                 raise ValueError(f"Cannot rename missing '{o}'")
         if any((n in inp.columns and n != o) for o, n in attr_pairs):
             raise ValueError("Rename target already exists")
-        out = inp.rename(columns=m).copy()
+        out = inp.rename(columns=m)
         if attr_pairs:
             aliases = {
                 alias: [m.get(c, c) for c in cols]
@@ -543,8 +939,7 @@ def eval(
         al, ar = _schema(L), _schema(R)
         if al != ar:
             raise ValueError(f"Union-compatibility failed: {al} vs {ar}")
-        tmp = pd.concat([L[al + ["_prov"]], R[ar + ["_prov"]]], ignore_index=True)
-        tmp = tmp.drop_duplicates(subset=al).reset_index(drop=True)
+        tmp = _union(L, R)
         tmp.attrs["aliases"] = _combine_aliases(
             list(tmp.columns), L.attrs.get("aliases", {}), R.attrs.get("aliases", {})
         )
@@ -564,13 +959,7 @@ def eval(
         al, ar = _schema(L), _schema(R)
         if al != ar:
             raise ValueError(f"Difference requires identical schemas: {al} vs {ar}")
-        merged = L.merge(R[ar], on=al, how="left", indicator=True)
-        out = (
-            merged[merged["_merge"] == "left_only"]
-            .drop(columns=["_merge"])
-            .reset_index(drop=True)
-        )
-        out["_prov"] = L.loc[out.index, "_prov"].tolist() if len(out) > 0 else []
+        out = _difference(L, R)
         out.attrs["aliases"] = _combine_aliases(
             list(out.columns), L.attrs.get("aliases", {}), R.attrs.get("aliases", {})
         )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, List
 from lark import Lark, Transformer, Token, Tree
 from pathlib import Path
@@ -115,16 +116,20 @@ class _ToAST(Transformer):
 
 def _build_parser():
     grammar = _GRAMMAR_PATH.read_text(encoding="utf-8")
-    return Lark(grammar, parser="lalr", maybe_placeholders=False)
+    # cache=True stores the compiled LALR tables in the temp dir, keyed by a
+    # hash of the grammar and options, so fresh processes skip the compile.
+    return Lark(grammar, parser="lalr", maybe_placeholders=False, cache=True)
 
 
-def _build_parser_fixed():
-    grammar = _GRAMMAR_PATH.read_text(encoding="utf-8")
-    return Lark(grammar, parser="lalr", maybe_placeholders=False)
+_PARSER = _build_parser()
 
 
-_PARSER = _build_parser_fixed()
+@lru_cache(maxsize=1024)
+def _parse_cached(text: str):
+    # Students resubmit the same expressions often; the evaluator never
+    # mutates AST nodes, so one parsed tree can be shared.
+    return _ToAST().transform(_PARSER.parse(text))
 
 
 def parse(text: str):
-    return _ToAST().transform(_PARSER.parse(text))
+    return _parse_cached(text)
@@ -12,6 +12,8 @@ from ..services.datasets import DatabaseSchema, DatabaseSummary, TableSchema
 
 router = APIRouter(prefix="/databases", tags=["databases"])
 
+_SCHEMA_PREVIEW_ROWS = 5
+
 
 class DatabaseSummaryResponse(BaseModel):
     name: str
@@ -41,6 +43,7 @@ class TableSchemaResponse(BaseModel):
     columns: List[ColumnSchemaResponse]
     row_count: int
     sample_rows: List[Dict[str, Any]]
+    row_count_estimated: bool = False
 
     @classmethod
     def from_table(cls, table: TableSchema) -> "TableSchemaResponse":
@@ -52,6 +55,7 @@ class TableSchemaResponse(BaseModel):
             ],
             row_count=table.row_count,
             sample_rows=table.sample_rows,
+            row_count_estimated=table.row_count_estimated,
         )
 
 
@@ -104,9 +108,16 @@ async def import_database_from_zip(
     if not file.filename or not file.filename.lower().endswith(".zip"):
         raise HTTPException(status_code=400, detail="Expected a .zip upload")
     try:
-        content = await file.read()
-        summary = datasets.create_database_from_zip(name, content, user_id=user["id"])
+        # Hand the spooled upload straight to zipfile instead of copying it
+        # into memory first; ZipFile only needs a seekable file object.
+        summary = datasets.create_database_from_zip(
+            name, file.file, user_id=user["id"]
+        )
         queries_service.clear_catalog_cache()
+        # Start building the preview now; the page asks for it next.
+        datasets.prefetch_schema(
+            summary.name, sample_rows=_SCHEMA_PREVIEW_ROWS, user_id=user["id"]
+        )
     except FileExistsError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(exc)
@@ -134,7 +145,7 @@ async def import_database_from_zip(
 )
 def get_database_schema(
     database: str,
-    sample_rows: int = 5,
+    sample_rows: int = _SCHEMA_PREVIEW_ROWS,
     user: Dict[str, Any] = Depends(require_current_user),
 ) -> DatabaseSchemaResponse:
     """Return column metadata and a row preview for each table in a database."""
@@ -180,6 +191,10 @@ async def import_database_from_sql(
             name, sql_script, user_id=user["id"]
         )
         queries_service.clear_catalog_cache()
+        # Start building the preview now; the page asks for it next.
+        datasets.prefetch_schema(
+            summary.name, sample_rows=_SCHEMA_PREVIEW_ROWS, user_id=user["id"]
+        )
     except FileExistsError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(exc)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import io
+import itertools
+import json
 import os
 import re
 import sqlite3
+import tempfile
+import threading
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from functools import lru_cache
 from pathlib import Path
 from pathlib import PurePosixPath
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -23,6 +28,8 @@ from .supabase import (
     list_user_datasets,
     storage_delete_prefix,
     storage_download_object,
+    storage_download_object_range,
+    storage_list_object_etags,
     storage_list_objects,
     storage_upload_object,
     upsert_user_dataset,
@@ -41,6 +48,7 @@ class TableSchema:
     columns: List[ColumnSchema]
     row_count: int
     sample_rows: List[Dict[str, object]]
+    row_count_estimated: bool = False
 
 
 @dataclass
@@ -70,10 +78,31 @@ class DatasetLocation:
     hidden: bool
 
 
-_SCHEMA_PREVIEW_CACHE: Dict[Tuple[str, str, int], "DatabaseSchema"] = {}
+# Module-level seam so tests can patch CSV parsing here rather than on pandas.
+_read_csv = pd.read_csv
+
+# Sharded by database name so clearing one database is a single pop.
+_SCHEMA_PREVIEW_CACHE: Dict[str, Dict[Tuple[str, int], "DatabaseSchema"]] = {}
+_PENDING_SCHEMA_PREVIEWS: Dict[Tuple[str, str, int], "Future[DatabaseSchema]"] = {}
+# Stamped by clear_schema_preview_cache (``None`` stands for "all databases");
+# a build that started before a clear must not store its result.
+_SCHEMA_PREVIEW_GENERATIONS: Dict[Optional[str], int] = {}
+_SCHEMA_PREVIEW_GENERATION_COUNTER = itertools.count(1)
+# Request threads and prefetch workers share the preview cache, its recency
+# order and the structures above; every access goes through this lock.
+_SCHEMA_PREVIEW_LOCK = threading.Lock()
 _DATABASE_ENV_CACHE: Dict[Tuple[str, str], Dict[str, pd.DataFrame]] = {}
+# Bundled CSVs are shared by every user; keyed by path and checked by mtime.
+_LOCAL_RELATION_CACHE: Dict[Path, Tuple[int, pd.DataFrame]] = {}
 _BUNDLED_DEFAULT_DATASETS = ("Sales", "University")
 _DATASETS_ROOT = Path(__file__).resolve().parents[2] / "datasets"
+_STORAGE_DOWNLOAD_WORKERS = 8
+_SCHEMA_PREFETCH_WORKERS = 2
+_SCHEMA_PREVIEW_MAX_ENTRIES = 128
+_PREVIEW_CELL_MAX_CHARS = 200
+# Schema previews only fetch a byte prefix of each remote CSV.
+_PREVIEW_RANGE_MIN_BYTES = 64 * 1024
+_PREVIEW_ROW_BYTES_ESTIMATE = 512
 
 
 class SqlImportError(ValueError):
@@ -139,15 +168,146 @@ def _schema_cache_key(
     return cache_user, cache_db, cache_rows
 
 
+def _schema_preview_generation(database: str) -> Tuple[int, int]:
+    return (
+        _SCHEMA_PREVIEW_GENERATIONS.get(None, 0),
+        _SCHEMA_PREVIEW_GENERATIONS.get(database, 0),
+    )
+
+
 def clear_schema_preview_cache(database: Optional[str] = None) -> None:
     if database is None:
-        _SCHEMA_PREVIEW_CACHE.clear()
+        with _SCHEMA_PREVIEW_LOCK:
+            _SCHEMA_PREVIEW_GENERATIONS[None] = next(_SCHEMA_PREVIEW_GENERATION_COUNTER)
+            _SCHEMA_PREVIEW_CACHE.clear()
+            _PENDING_SCHEMA_PREVIEWS.clear()
+        _clear_schema_disk_cache(None)
         return
 
     normalised = _normalise_database_name(database)
-    stale_keys = [key for key in _SCHEMA_PREVIEW_CACHE if key[1] == normalised]
-    for key in stale_keys:
-        _SCHEMA_PREVIEW_CACHE.pop(key, None)
+    with _SCHEMA_PREVIEW_LOCK:
+        _SCHEMA_PREVIEW_GENERATIONS[normalised] = next(
+            _SCHEMA_PREVIEW_GENERATION_COUNTER
+        )
+        _SCHEMA_PREVIEW_CACHE.pop(normalised, None)
+        for key in [key for key in _PENDING_SCHEMA_PREVIEWS if key[1] == normalised]:
+            _PENDING_SCHEMA_PREVIEWS.pop(key, None)
+    _clear_schema_disk_cache(normalised)
+
+
+def _cached_schema_preview(key: Tuple[str, str, int]) -> Optional[DatabaseSchema]:
+    cache_user, cache_db, cache_rows = key
+    with _SCHEMA_PREVIEW_LOCK:
+        shard = _SCHEMA_PREVIEW_CACHE.get(cache_db)
+        if not shard:
+            return None
+        schema = shard.pop((cache_user, cache_rows), None)
+        if schema is None:
+            return None
+        # Re-insert at the end so dict order doubles as recency for eviction.
+        shard[(cache_user, cache_rows)] = schema
+        _SCHEMA_PREVIEW_CACHE[cache_db] = _SCHEMA_PREVIEW_CACHE.pop(cache_db)
+        return schema
+
+
+def _store_schema_preview(
+    key: Tuple[str, str, int],
+    schema: DatabaseSchema,
+    generation: Tuple[int, int],
+) -> bool:
+    """Cache ``schema`` unless the database was cleared since ``generation``."""
+    cache_user, cache_db, cache_rows = key
+    with _SCHEMA_PREVIEW_LOCK:
+        if _schema_preview_generation(cache_db) != generation:
+            return False
+        shard = _SCHEMA_PREVIEW_CACHE.pop(cache_db, {})
+        shard.pop((cache_user, cache_rows), None)
+        shard[(cache_user, cache_rows)] = schema
+        _SCHEMA_PREVIEW_CACHE[cache_db] = shard
+
+        # Evict from the least recently used database until back under the cap.
+        entries = sum(len(entries) for entries in _SCHEMA_PREVIEW_CACHE.values())
+        while entries > _SCHEMA_PREVIEW_MAX_ENTRIES:
+            oldest_db = next(iter(_SCHEMA_PREVIEW_CACHE))
+            oldest = _SCHEMA_PREVIEW_CACHE[oldest_db]
+            if oldest:
+                oldest.pop(next(iter(oldest)))
+                entries -= 1
+            if not oldest:
+                del _SCHEMA_PREVIEW_CACHE[oldest_db]
+        return True
+
+
+def _schema_disk_cache_path(key: Tuple[str, str, int]) -> Optional[Path]:
+    # Opt-in second tier so previews survive worker restarts; off unless
+    # RA_SCHEMA_CACHE_DIR is set.
+    configured = os.getenv("RA_SCHEMA_CACHE_DIR", "").strip()
+    if not configured:
+        return None
+    cache_user, cache_db, cache_rows = key
+    user_part = _normalise_user_id(cache_user) if cache_user else "_"
+    return Path(configured) / cache_db / f"{user_part}-{cache_rows}.json"
+
+
+def _read_schema_disk_cache(
+    path: Path, etags: Dict[str, Optional[str]]
+) -> Optional[DatabaseSchema]:
+    # Entries are only trusted while every table object still has the ETag
+    # it was built from, so out-of-band re-uploads invalidate them.
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        if entry["etags"] != etags:
+            return None
+        payload = entry["schema"]
+        return DatabaseSchema(
+            name=payload["name"],
+            tables=[
+                TableSchema(
+                    name=table["name"],
+                    columns=[ColumnSchema(**column) for column in table["columns"]],
+                    row_count=table["row_count"],
+                    sample_rows=table["sample_rows"],
+                    row_count_estimated=table.get("row_count_estimated", False),
+                )
+                for table in payload["tables"]
+            ],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_schema_disk_cache(
+    path: Path, etags: Dict[str, Optional[str]], schema: DatabaseSchema
+) -> None:
+    entry = {"etags": etags, "schema": asdict(schema)}
+    tmp_name: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer: two threads or processes storing the
+        # same entry must never interleave writes into one file.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f"{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp_name = tmp.name
+            json.dump(entry, tmp, default=str)
+        os.replace(tmp_name, path)
+    except OSError:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _clear_schema_disk_cache(database: Optional[str]) -> None:
+    configured = os.getenv("RA_SCHEMA_CACHE_DIR", "").strip()
+    if not configured:
+        return
+    pattern = f"{database}/*.json" if database is not None else "*/*.json"
+    for path in Path(configured).glob(pattern):
+        path.unlink(missing_ok=True)
 
 
 def _database_env_cache_key(
@@ -178,6 +338,59 @@ def _approximate_csv_row_count(raw: bytes) -> int:
     return max(line_count - 1, 0)
 
 
+def _preview_range_length(sample_rows: int) -> int:
+    return max(
+        _PREVIEW_RANGE_MIN_BYTES, max(sample_rows, 0) * _PREVIEW_ROW_BYTES_ESTIMATE
+    )
+
+
+def _complete_csv_lines(
+    raw: bytes, total_size: Optional[int], sample_rows: int
+) -> Optional[bytes]:
+    """Trim a ranged read to whole lines, or ``None`` if it is too short.
+
+    The prefix must hold the header plus enough complete rows for the sample
+    (and at least one to extrapolate the row count from); otherwise the
+    caller falls back to downloading the whole object.
+    """
+    if total_size is None or total_size <= len(raw):
+        return raw
+    # A ranged read usually stops mid-row; drop the partial trailing line.
+    end = raw.rfind(b"\n")
+    if raw.count(b"\n", 0, end + 1) < max(sample_rows, 1) + 1:
+        return None
+    return raw[: end + 1]
+
+
+def _estimate_csv_row_count(raw: bytes, total_size: Optional[int]) -> int:
+    """Row count of a CSV of which ``raw`` holds only complete leading lines.
+
+    Exact when ``raw`` is the whole object; otherwise extrapolated from the
+    average row width of the prefix.
+    """
+    rows = _approximate_csv_row_count(raw)
+    if total_size is None or total_size <= len(raw) or rows == 0:
+        return rows
+    header_bytes = raw.find(b"\n") + 1
+    return round((total_size - header_bytes) * rows / (len(raw) - header_bytes))
+
+
+def _truncate_preview_value(value: object) -> object:
+    if isinstance(value, str) and len(value) > _PREVIEW_CELL_MAX_CHARS:
+        return value[:_PREVIEW_CELL_MAX_CHARS] + "…"
+    return value
+
+
+def _preview_records(preview_df: pd.DataFrame) -> List[Dict[str, object]]:
+    # Long text cells are clipped so a single wide column cannot blow up the
+    # schema preview payload; full values remain available for evaluation.
+    preview_df = preview_df.where(pd.notnull(preview_df), None)
+    return [
+        {col: _truncate_preview_value(value) for col, value in row.items()}
+        for row in preview_df.to_dict(orient="records")
+    ]
+
+
 def _bundled_default_names() -> Tuple[str, ...]:
     configured = os.getenv("RA_BUNDLED_DEFAULT_DATASETS", "").strip()
     names = (
@@ -255,10 +468,17 @@ def clear_dataset_metadata_cache() -> None:
 
 
 def _load_local_relation_dataframe(path: Path, relation_name: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    # Callers clone the env before handing it out, so the cached frame is
+    # returned as-is.
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _LOCAL_RELATION_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    df = _read_csv(path)
     df = df.copy()
     df.columns = [c.lower() for c in df.columns]
     df["_prov"] = [[(relation_name, int(i))] for i in range(len(df))]
+    _LOCAL_RELATION_CACHE[path] = (mtime_ns, df)
     return df
 
 
@@ -367,9 +587,13 @@ def _upload_csv_map(
         )
 
 
-def _extract_csv_map_from_zip(zip_bytes: bytes) -> Dict[str, bytes]:
+def _extract_csv_map_from_zip(zip_source: Union[bytes, BinaryIO]) -> Dict[str, bytes]:
+    if isinstance(zip_source, (bytes, bytearray)):
+        zip_source = io.BytesIO(zip_source)
+    else:
+        zip_source.seek(0)
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+        with zipfile.ZipFile(zip_source) as archive:
             members = [info for info in archive.infolist() if not info.is_dir()]
             csv_map: Dict[str, bytes] = {}
             for info in members:
@@ -498,11 +722,11 @@ def _user_dataset_prefix(user_id: str, database: str) -> str:
     return f"{safe_user}/{safe_db}"
 
 
-def create_database_from_zip(
+def _create_user_database(
     database: str,
-    zip_bytes: bytes,
+    build_csv_map: Callable[[], Dict[str, bytes]],
     *,
-    user_id: Optional[str] = None,
+    user_id: Optional[str],
 ) -> DatabaseSummary:
     if not user_id:
         raise ValueError("Authenticated user id is required for dataset import.")
@@ -519,7 +743,7 @@ def create_database_from_zip(
     if existing and existing.source_type == "user" and not existing.hidden:
         raise FileExistsError(f"Database '{name}' already exists")
 
-    csv_map = _extract_csv_map_from_zip(zip_bytes)
+    csv_map = build_csv_map()
     bucket = os.getenv("SUPABASE_USER_DATASETS_BUCKET", "ra-user-datasets")
     prefix = _user_dataset_prefix(user_id, name)
     if existing and existing.source_type == "user":
@@ -547,52 +771,29 @@ def create_database_from_zip(
     )
 
 
-def create_database_from_sql(
+def create_database_from_zip(
     database: str,
-    sql_script: str,
+    zip_source: Union[bytes, BinaryIO],
     *,
     user_id: Optional[str] = None,
 ) -> DatabaseSummary:
-    if not user_id:
-        raise ValueError("Authenticated user id is required for dataset import.")
-
-    name = _normalise_database_name(database)
-    default_rows = _default_rows_by_name()
-    if name in default_rows:
-        raise ValueError(
-            f"Database '{name}' is a shared default name and cannot be overwritten."
-        )
-
-    user_rows = _user_rows_by_name(user_id)
-    existing = user_rows.get(name)
-    if existing and existing.source_type == "user" and not existing.hidden:
-        raise FileExistsError(f"Database '{name}' already exists")
+    return _create_user_database(
+        database,
+        lambda: _extract_csv_map_from_zip(zip_source),
+        user_id=user_id,
+    )
 
-    csv_map = _extract_csv_map_from_sql(sql_script)
-    bucket = os.getenv("SUPABASE_USER_DATASETS_BUCKET", "ra-user-datasets")
-    prefix = _user_dataset_prefix(user_id, name)
-    if existing and existing.source_type == "user":
-        storage_delete_prefix(existing.bucket_name, existing.object_prefix)
-    _upload_csv_map(bucket=bucket, prefix=prefix, csv_map=csv_map)
 
-    upsert_user_dataset(
+def create_database_from_sql(
+    database: str,
+    sql_script: str,
+    *,
+    user_id: Optional[str] = None,
+) -> DatabaseSummary:
+    return _create_user_database(
+        database,
+        lambda: _extract_csv_map_from_sql(sql_script),
         user_id=user_id,
-        database_name=name,
-        source_type="user",
-        bucket_name=bucket,
-        object_prefix=prefix,
-        is_default=False,
-        hidden=False,
-    )
-    clear_dataset_metadata_cache()
-    clear_schema_preview_cache(name)
-    clear_database_env_cache(name)
-    from . import sql as sql_service
-    sql_service.clear_sqlite_cache(name)
-    return DatabaseSummary(
-        name=name,
-        tables=sorted(PurePosixPath(f).stem.lower() for f in csv_map.keys()),
-        is_default=False,
     )
 
 
@@ -644,9 +845,54 @@ def is_default_database(database: str) -> bool:
     return name in _default_rows_by_name()
 
 
-def _load_relation_dataframe(bucket: str, object_path: str, relation_name: str) -> pd.DataFrame:
-    raw = storage_download_object(bucket, object_path)
-    df = pd.read_csv(io.BytesIO(raw))
+@lru_cache(maxsize=1)
+def _storage_download_executor() -> ThreadPoolExecutor:
+    # Shared for the lifetime of the process so table downloads reuse worker
+    # threads (and their pooled HTTP connections) across requests.
+    return ThreadPoolExecutor(
+        max_workers=_STORAGE_DOWNLOAD_WORKERS,
+        thread_name_prefix="dataset-download",
+    )
+
+
+@lru_cache(maxsize=1)
+def _schema_prefetch_executor() -> ThreadPoolExecutor:
+    # Kept apart from the download pool: prefetch tasks fan out their table
+    # downloads onto that pool and must not wait on their own workers.
+    return ThreadPoolExecutor(
+        max_workers=_SCHEMA_PREFETCH_WORKERS,
+        thread_name_prefix="schema-prefetch",
+    )
+
+
+def _download_objects(bucket: str, object_paths: List[str]) -> List[bytes]:
+    if len(object_paths) <= 1:
+        return [storage_download_object(bucket, path) for path in object_paths]
+    return list(
+        _storage_download_executor().map(
+            lambda path: storage_download_object(bucket, path), object_paths
+        )
+    )
+
+
+def _download_preview_objects(
+    bucket: str, object_paths: List[str], length: int
+) -> List[Tuple[bytes, Optional[int]]]:
+    if len(object_paths) <= 1:
+        return [
+            storage_download_object_range(bucket, path, length)
+            for path in object_paths
+        ]
+    return list(
+        _storage_download_executor().map(
+            lambda path: storage_download_object_range(bucket, path, length),
+            object_paths,
+        )
+    )
+
+
+def _load_relation_dataframe(raw: bytes, relation_name: str) -> pd.DataFrame:
+    df = _read_csv(io.BytesIO(raw))
     df = df.copy()
     df.columns = [c.lower() for c in df.columns]
     df["_prov"] = [[(relation_name, int(i))] for i in range(len(df))]
@@ -685,15 +931,45 @@ def load_database_env(
     if not csv_names:
         raise ValueError(f"Database '{database}' does not contain any CSV files")
 
+    sorted_names = sorted(csv_names)
+    raw_objects = _download_objects(
+        location.bucket,
+        [_join_prefix(location.prefix, name) for name in sorted_names],
+    )
     env: Dict[str, pd.DataFrame] = {}
-    for name in sorted(csv_names):
+    for name, raw in zip(sorted_names, raw_objects):
         relation = PurePosixPath(name).stem.lower()
-        object_path = _join_prefix(location.prefix, name)
-        env[relation] = _load_relation_dataframe(location.bucket, object_path, relation)
+        env[relation] = _load_relation_dataframe(raw, relation)
     _DATABASE_ENV_CACHE[key] = _clone_database_env(env)
     return _clone_database_env(env)
 
 
+def prefetch_schema(
+    database: str,
+    sample_rows: int = 10,
+    *,
+    user_id: Optional[str] = None,
+) -> "Future[DatabaseSchema]":
+    """Build a schema preview in the background so the first view is a hit."""
+    key = _schema_cache_key(database, sample_rows, user_id)
+    with _SCHEMA_PREVIEW_LOCK:
+        pending = _PENDING_SCHEMA_PREVIEWS.get(key)
+        if pending is not None:
+            return pending
+        future = _schema_prefetch_executor().submit(
+            _build_database_schema, database, sample_rows, user_id, key
+        )
+        _PENDING_SCHEMA_PREVIEWS[key] = future
+
+    def _forget(done: "Future[DatabaseSchema]") -> None:
+        with _SCHEMA_PREVIEW_LOCK:
+            if _PENDING_SCHEMA_PREVIEWS.get(key) is done:
+                _PENDING_SCHEMA_PREVIEWS.pop(key, None)
+
+    future.add_done_callback(_forget)
+    return future
+
+
 def get_database_schema(
     database: str,
     sample_rows: int = 10,
@@ -701,10 +977,30 @@ def get_database_schema(
     user_id: Optional[str] = None,
 ) -> DatabaseSchema:
     key = _schema_cache_key(database, sample_rows, user_id)
-    cached = _SCHEMA_PREVIEW_CACHE.get(key)
+    cached = _cached_schema_preview(key)
     if cached is not None:
         return cached
 
+    with _SCHEMA_PREVIEW_LOCK:
+        pending = _PENDING_SCHEMA_PREVIEWS.get(key)
+    if pending is not None:
+        try:
+            return pending.result()
+        except Exception:
+            # A failed prefetch is retried below so the caller sees the
+            # error from its own request.
+            pass
+    return _build_database_schema(database, sample_rows, user_id, key)
+
+
+def _build_database_schema(
+    database: str,
+    sample_rows: int,
+    user_id: Optional[str],
+    key: Tuple[str, str, int],
+) -> DatabaseSchema:
+    with _SCHEMA_PREVIEW_LOCK:
+        generation = _schema_preview_generation(key[1])
     local_root = _bundled_default_root(database)
     if local_root and not _is_default_hidden_for_user(database, user_id):
         csv_paths = sorted(path for path in local_root.glob("*.csv") if path.is_file())
@@ -715,15 +1011,14 @@ def get_database_schema(
         for path in csv_paths:
             raw = path.read_bytes()
             row_count = _approximate_csv_row_count(raw)
-            preview_df = pd.read_csv(io.BytesIO(raw), nrows=max(sample_rows, 0))
+            preview_df = _read_csv(io.BytesIO(raw), nrows=max(sample_rows, 0))
             preview_df = preview_df.copy()
             preview_df.columns = [c.lower() for c in preview_df.columns]
             columns = [
                 ColumnSchema(name=col, dtype=str(preview_df[col].dtype))
                 for col in preview_df.columns
             ]
-            preview_df = preview_df.where(pd.notnull(preview_df), None)
-            sample = preview_df.to_dict(orient="records")
+            sample = _preview_records(preview_df)
             tables.append(
                 TableSchema(
                     name=path.stem.lower(),
@@ -733,40 +1028,81 @@ def get_database_schema(
                 )
             )
         schema = DatabaseSchema(name=database, tables=tables)
-        _SCHEMA_PREVIEW_CACHE[key] = schema
+        _store_schema_preview(key, schema, generation)
         return schema
 
     location = _resolve_location(database, user_id)
-    names = storage_list_objects(location.bucket, location.prefix)
-    csv_names = [name for name in names if PurePosixPath(name).suffix.lower() == ".csv"]
+    object_etags = storage_list_object_etags(location.bucket, location.prefix)
+    csv_names = [
+        name for name in object_etags if PurePosixPath(name).suffix.lower() == ".csv"
+    ]
     if not csv_names:
         raise ValueError(f"Database '{database}' does not contain any CSV files")
 
+    sorted_names = sorted(csv_names)
+    etags = {name: object_etags[name] for name in sorted_names}
+    disk_path = (
+        _schema_disk_cache_path(key) if None not in etags.values() else None
+    )
+    if disk_path is not None:
+        cached = _read_schema_disk_cache(disk_path, etags)
+        if cached is not None:
+            _store_schema_preview(key, cached, generation)
+            return cached
+
+    prefixes = _download_preview_objects(
+        location.bucket,
+        [_join_prefix(location.prefix, name) for name in sorted_names],
+        _preview_range_length(sample_rows),
+    )
     tables: List[TableSchema] = []
-    for name in sorted(csv_names):
+    for name, (raw, total_size) in zip(sorted_names, prefixes):
         relation = PurePosixPath(name).stem.lower()
-        object_path = _join_prefix(location.prefix, name)
-        raw = storage_download_object(location.bucket, object_path)
-        row_count = _approximate_csv_row_count(raw)
-        preview_df = pd.read_csv(io.BytesIO(raw), nrows=max(sample_rows, 0))
+        complete = _complete_csv_lines(raw, total_size, sample_rows)
+        preview_df = None
+        if complete is not None:
+            try:
+                preview_df = _read_csv(io.BytesIO(complete), nrows=max(sample_rows, 0))
+            except pd.errors.ParserError:
+                # The cut landed inside a quoted multi-line field.
+                if total_size is None:
+                    raise
+        if preview_df is None:
+            # Never parse a cut-off line: read and parse the whole object
+            # instead, which also gives an exact count with multi-line fields.
+            full_df = _read_csv(
+                io.BytesIO(
+                    storage_download_object(
+                        location.bucket, _join_prefix(location.prefix, name)
+                    )
+                )
+            )
+            row_count = len(full_df)
+            row_count_estimated = False
+            preview_df = full_df.head(max(sample_rows, 0))
+        else:
+            row_count = _estimate_csv_row_count(complete, total_size)
+            row_count_estimated = total_size is not None and total_size > len(complete)
         preview_df = preview_df.copy()
         preview_df.columns = [c.lower() for c in preview_df.columns]
         columns = [
             ColumnSchema(name=col, dtype=str(preview_df[col].dtype))
             for col in preview_df.columns
         ]
-        preview_df = preview_df.where(pd.notnull(preview_df), None)
-        sample = preview_df.to_dict(orient="records")
+        sample = _preview_records(preview_df)
         tables.append(
             TableSchema(
                 name=relation,
                 columns=columns,
                 row_count=row_count,
                 sample_rows=sample,
+                row_count_estimated=row_count_estimated,
             )
         )
     schema = DatabaseSchema(name=database, tables=tables)
-    _SCHEMA_PREVIEW_CACHE[key] = schema
+    stored = _store_schema_preview(key, schema, generation)
+    if stored and disk_path is not None:
+        _write_schema_disk_cache(disk_path, etags, schema)
     return schema
 
 
@@ -784,7 +1120,7 @@ def get_table_schema(
             raise FileNotFoundError(
                 f"Relation '{relation}' not found in database '{database}'"
             )
-        df = pd.read_csv(path)
+        df = _read_csv(path)
         df = df.copy()
         df.columns = [c.lower() for c in df.columns]
         columns = [
@@ -792,8 +1128,7 @@ def get_table_schema(
             for col in df.columns
         ]
         preview_df = df.head(sample_rows).copy()
-        preview_df = preview_df.where(pd.notnull(preview_df), None)
-        sample = preview_df.to_dict(orient="records")
+        sample = _preview_records(preview_df)
         return TableSchema(
             name=relation.lower(),
             columns=columns,
@@ -811,13 +1146,12 @@ def get_table_schema(
         )
     object_path = _join_prefix(location.prefix, object_name)
     raw = storage_download_object(location.bucket, object_path)
-    df = pd.read_csv(io.BytesIO(raw))
+    df = _read_csv(io.BytesIO(raw))
     df = df.copy()
     df.columns = [c.lower() for c in df.columns]
     columns = [ColumnSchema(name=col, dtype=str(df[col].dtype)) for col in df.columns]
     preview_df = df.head(sample_rows).copy()
-    preview_df = preview_df.where(pd.notnull(preview_df), None)
-    sample = preview_df.to_dict(orient="records")
+    sample = _preview_records(preview_df)
     return TableSchema(
         name=relation_lower,
         columns=columns,
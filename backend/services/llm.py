@@ -4,6 +4,7 @@ import logging
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -81,6 +82,12 @@ def _format_schema(schema: List[Dict[str, Any]]) -> str:
     return "\n".join(lines) if lines else "- No schema available"
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    # Reused across hint/walkthrough calls so the provider connection stays alive.
+    return requests.Session()
+
+
 def _chat_completion(
     *,
     base_url: str,
@@ -90,7 +97,7 @@ def _chat_completion(
     user_prompt: str,
 ) -> Dict[str, Any]:
     try:
-        response = requests.post(
+        response = _http_session().post(
             f"{base_url}/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
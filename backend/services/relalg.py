@@ -121,7 +121,8 @@ def _rows_from_dataframe(df: pd.DataFrame) -> List[Dict[str, object]]:
     schema = [c for c in df.columns if c != "_prov"]
     if not schema:
         return []
-    preview = df[schema].copy()
+    # where() already returns a new frame, so no defensive copy is needed.
+    preview = df[schema]
     preview = preview.where(pd.notnull(preview), None)
     return preview.to_dict(orient="records")
 
@@ -22,8 +22,7 @@ class SqlEvaluationResult:
 
 
 def _rows_from_dataframe(df: pd.DataFrame) -> List[Dict[str, object]]:
-    preview = df.copy()
-    preview = preview.where(pd.notnull(preview), None)
+    preview = df.where(pd.notnull(df), None)
     return preview.to_dict(orient="records")
 
 
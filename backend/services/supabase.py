@@ -3,15 +3,18 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
+import http.cookiejar
 import json
 import os
 import secrets
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class SupabaseError(Exception):
@@ -35,6 +38,7 @@ class SupabaseStorageError(SupabaseError):
 
 
 _OAUTH_STATE_TTL_SECONDS = 600
+_HTTP_POOL_SIZE = 16
 
 
 @dataclass
@@ -117,6 +121,20 @@ def _service_headers() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    # One keep-alive session for every Supabase call so repeated requests skip
+    # the TCP/TLS handshake. Pool sized for the parallel dataset downloads.
+    # The session is shared by every user's auth calls, so it must never
+    # remember a cookie from one response and replay it on another request.
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _request_json(
     method: str,
     url: str,
@@ -129,7 +147,7 @@ def _request_json(
     error_cls: type[SupabaseError] = SupabaseError,
     error_message: str = "Supabase request failed.",
 ) -> Any:
-    response = requests.request(
+    response = _http_session().request(
         method,
         url,
         headers=headers,
@@ -149,7 +167,7 @@ def _request_json(
         raise error_cls("Supabase response was not valid JSON.") from exc
 
 
-def _request_bytes(
+def _request_raw(
     method: str,
     url: str,
     *,
@@ -158,8 +176,8 @@ def _request_bytes(
     timeout: int = 20,
     error_cls: type[SupabaseError] = SupabaseError,
     error_message: str = "Supabase request failed.",
-) -> bytes:
-    response = requests.request(
+) -> requests.Response:
+    response = _http_session().request(
         method,
         url,
         headers=headers,
@@ -169,7 +187,28 @@ def _request_bytes(
     if response.status_code >= 400:
         detail = response.text.strip() or error_message
         raise error_cls(detail)
-    return response.content
+    return response
+
+
+def _request_bytes(
+    method: str,
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+    timeout: int = 20,
+    error_cls: type[SupabaseError] = SupabaseError,
+    error_message: str = "Supabase request failed.",
+) -> bytes:
+    return _request_raw(
+        method,
+        url,
+        headers=headers,
+        params=params,
+        timeout=timeout,
+        error_cls=error_cls,
+        error_message=error_message,
+    ).content
 
 
 def _generate_code_verifier() -> str:
@@ -403,7 +442,7 @@ def delete_user_dataset(user_id: str, database_name: str) -> None:
     )
 
 
-def storage_list_objects(bucket: str, prefix: str) -> List[str]:
+def _storage_list_items(bucket: str, prefix: str) -> List[Dict[str, Any]]:
     payload = _request_json(
         "POST",
         f"{_supabase_url()}/storage/v1/object/list/{bucket}",
@@ -422,13 +461,28 @@ def storage_list_objects(bucket: str, prefix: str) -> List[str]:
     )
     if not isinstance(payload, list):
         return []
-    files: List[str] = []
-    for item in payload:
-        name = str(item.get("name") or "").strip()
-        item_id = item.get("id")
-        if name and item_id:
-            files.append(name)
-    return files
+    # Folder placeholders come back without an id; only real objects count.
+    return [
+        item
+        for item in payload
+        if str(item.get("name") or "").strip() and item.get("id")
+    ]
+
+
+def storage_list_objects(bucket: str, prefix: str) -> List[str]:
+    return [
+        str(item["name"]).strip() for item in _storage_list_items(bucket, prefix)
+    ]
+
+
+def storage_list_object_etags(bucket: str, prefix: str) -> Dict[str, Optional[str]]:
+    """Map each object name under ``prefix`` to its ETag, in listing order."""
+    etags: Dict[str, Optional[str]] = {}
+    for item in _storage_list_items(bucket, prefix):
+        metadata = item.get("metadata") or {}
+        etag = metadata.get("eTag") if isinstance(metadata, dict) else None
+        etags[str(item["name"]).strip()] = str(etag) if etag else None
+    return etags
 
 
 def storage_download_object(bucket: str, object_path: str) -> bytes:
@@ -442,6 +496,34 @@ def storage_download_object(bucket: str, object_path: str) -> bytes:
     )
 
 
+def storage_download_object_range(
+    bucket: str, object_path: str, length: int
+) -> Tuple[bytes, Optional[int]]:
+    """Download the first ``length`` bytes of an object.
+
+    Returns the bytes together with the full object size when the server
+    answered with a partial response, or ``None`` when the body is the whole
+    object (either it fit in the range or the range was ignored). A partial
+    response without a usable size is replaced by a full download, so
+    ``None`` always means the bytes are complete.
+    """
+    path = object_path.strip("/")
+    response = _request_raw(
+        "GET",
+        f"{_supabase_url()}/storage/v1/object/{bucket}/{path}",
+        headers={**_service_headers(), "Range": f"bytes=0-{max(length, 1) - 1}"},
+        error_cls=SupabaseStorageError,
+        error_message="Failed to download storage object.",
+    )
+    if response.status_code != 206:
+        return response.content, None
+    # Content-Range: bytes 0-65535/1048576 (the size may be "*" if unknown)
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if not total.isdigit():
+        return storage_download_object(bucket, object_path), None
+    return response.content, int(total)
+
+
 def storage_upload_object(
     *,
     bucket: str,
@@ -1,12 +1,16 @@
+import { lazy } from 'react';
 import { BrowserRouter, Routes, Route } from 'react-router-dom';
 import { AuthProvider } from './lib/auth';
 import Layout from './components/Layout';
 import ProtectedRoute from './components/ProtectedRoute';
 import Home from './pages/Home';
-import DatabaseManager from './pages/DatabaseManager';
-import RAExercises from './pages/RAExercises';
-import RASQLReference from './pages/RASQLReference';
-import ProgressDashboard from './pages/ProgressDashboard';
+
+// Tool pages are split into their own chunks so the landing page does not
+// pay for the exercise and reference bundles until they are visited.
+const DatabaseManager = lazy(() => import('./pages/DatabaseManager'));
+const RAExercises = lazy(() => import('./pages/RAExercises'));
+const RASQLReference = lazy(() => import('./pages/RASQLReference'));
+const ProgressDashboard = lazy(() => import('./pages/ProgressDashboard'));
 
 export default function App() {
   return (
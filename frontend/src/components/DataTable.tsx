@@ -1,3 +1,5 @@
+import { memo } from 'react';
+
 interface Props {
   rows: Record<string, unknown>[];
   columns?: string[];
@@ -5,7 +7,7 @@ interface Props {
   maxHeight?: string;
 }
 
-export default function DataTable({ rows, columns, compact, maxHeight }: Props) {
+function DataTable({ rows, columns, compact, maxHeight }: Props) {
   if (!rows.length) return <p className="text-sm italic text-[#7c5433]">No rows to display.</p>;
 
   const cols = columns ?? Object.keys(rows[0]);
@@ -25,11 +27,14 @@ export default function DataTable({ rows, columns, compact, maxHeight }: Props)
         <tbody className="divide-y divide-[#f2e1c7] bg-white/95">
           {rows.map((row, i) => (
             <tr key={i} className="transition-colors hover:bg-[#fff4df]">
-              {cols.map((col) => (
-                <td key={col} className="whitespace-nowrap px-3 py-1.5 text-[#5c3b1f]">
-                  {row[col] == null ? <span className="italic text-[#8b6a50]">NULL</span> : String(row[col])}
-                </td>
-              ))}
+              {cols.map((col) => {
+                const value = row[col];
+                return (
+                  <td key={col} className="whitespace-nowrap px-3 py-1.5 text-[#5c3b1f]">
+                    {value == null ? <span className="italic text-[#8b6a50]">NULL</span> : typeof value === 'string' ? value : String(value)}
+                  </td>
+                );
+              })}
             </tr>
           ))}
         </tbody>
@@ -37,3 +42,7 @@ export default function DataTable({ rows, columns, compact, maxHeight }: Props)
     </div>
   );
 }
+
+// Rows come straight from API results, so references stay stable between page
+// re-renders (e.g. typing in the editor) and the table body can be skipped.
+export default memo(DataTable);
@@ -1,3 +1,4 @@
+import { Suspense } from 'react';
 import { NavLink, Outlet, useLocation } from 'react-router-dom';
 import { useAuth } from '../lib/useAuth';
 import {
@@ -88,7 +89,9 @@ export default function Layout() {
 
       <main id="main-content" tabIndex={-1} className="pb-12 pt-6">
         <div className={containerClass}>
-          <Outlet />
+          <Suspense fallback={null}>
+            <Outlet />
+          </Suspense>
         </div>
       </main>
     </div>
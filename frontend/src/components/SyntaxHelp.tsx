@@ -1,3 +1,17 @@
+import { memo } from 'react';
+
+const OPERATORS = [
+  { symbol: 'π', name: 'Projection', usage: 'π{attr1,attr2}(R)', aliases: 'pi' },
+  { symbol: 'σ', name: 'Selection', usage: 'σ{condition}(R)', aliases: 'sigma' },
+  { symbol: 'ρ', name: 'Rename', usage: 'ρ alias(R) or ρ{old->new}(R)', aliases: 'rho' },
+  { symbol: '⋈', name: 'Natural Join', usage: 'R ⋈ S', aliases: 'natural_join, natjoin, njoin' },
+  { symbol: '×', name: 'Cartesian Product', usage: 'R × S', aliases: 'x or cross' },
+  { symbol: '∪', name: 'Union', usage: 'R ∪ S', aliases: 'union' },
+  { symbol: '−', name: 'Difference', usage: 'R − S', aliases: '-, diff' },
+  { symbol: '∩', name: 'Intersection', usage: 'R ∩ S', aliases: 'intersect' },
+  { symbol: '÷', name: 'Division', usage: 'R ÷ S', aliases: '/, div' },
+];
+
 interface Props {
   database?: string;
 }
@@ -24,24 +38,12 @@ function Example({ database }: { database?: string }) {
   );
 }
 
-export default function SyntaxHelp({ database }: Props) {
-  const ops = [
-    { symbol: 'π', name: 'Projection', usage: 'π{attr1,attr2}(R)', aliases: 'pi' },
-    { symbol: 'σ', name: 'Selection', usage: 'σ{condition}(R)', aliases: 'sigma' },
-    { symbol: 'ρ', name: 'Rename', usage: 'ρ alias(R) or ρ{old->new}(R)', aliases: 'rho' },
-    { symbol: '⋈', name: 'Natural Join', usage: 'R ⋈ S', aliases: 'natural_join, natjoin, njoin' },
-    { symbol: '×', name: 'Cartesian Product', usage: 'R × S', aliases: 'x or cross' },
-    { symbol: '∪', name: 'Union', usage: 'R ∪ S', aliases: 'union' },
-    { symbol: '−', name: 'Difference', usage: 'R − S', aliases: '-, diff' },
-    { symbol: '∩', name: 'Intersection', usage: 'R ∩ S', aliases: 'intersect' },
-    { symbol: '÷', name: 'Division', usage: 'R ÷ S', aliases: '/, div' },
-  ];
-
+function SyntaxHelp({ database }: Props) {
   return (
     <div className="space-y-4">
       <h4 className="font-display text-lg font-semibold text-[#5c3b1f]">Supported Relational Algebra Syntax</h4>
       <ul className="space-y-1.5 text-sm">
-        {ops.map((op) => (
+        {OPERATORS.map((op) => (
           <li key={op.symbol}>
             <span className="font-bold text-[var(--color-op)]">{op.symbol}</span>{' '}
             <span className="font-semibold text-[#5c3b1f]">{op.name}</span>:{' '}
@@ -55,3 +57,6 @@ export default function SyntaxHelp({ database }: Props) {
     </div>
   );
 }
+
+// Static content; only re-renders when the selected database changes.
+export default memo(SyntaxHelp);
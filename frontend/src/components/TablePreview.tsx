@@ -1,4 +1,4 @@
-import { useId, useState } from 'react';
+import { memo, useId, useMemo, useState } from 'react';
 import { ChevronDown, Eye } from 'lucide-react';
 import type { TableInfo } from '../lib/api';
 import DataTable from './DataTable';
@@ -8,9 +8,10 @@ interface Props {
   metadata?: TableInfo;
 }
 
-export default function TablePreview({ tableName, metadata }: Props) {
+function TablePreview({ tableName, metadata }: Props) {
   const [open, setOpen] = useState(false);
   const panelId = useId();
+  const columnNames = useMemo(() => (metadata?.columns ?? []).map((col) => col.name), [metadata]);
 
   if (!metadata) {
     return (
@@ -21,9 +22,11 @@ export default function TablePreview({ tableName, metadata }: Props) {
     );
   }
 
-  const columns = metadata.columns ?? [];
   const sampleRows = metadata.sample_rows ?? [];
-  const rowCountLabel = metadata.row_count != null ? `${metadata.row_count} rows` : 'Schema available';
+  const rowCount = metadata.row_count != null
+    ? `${metadata.row_count_estimated ? '~' : ''}${metadata.row_count}`
+    : null;
+  const rowCountLabel = rowCount != null ? `${rowCount} rows` : 'Schema available';
 
   return (
     <div className="rounded-2xl border border-[#e8efe7] bg-white/68 px-3 py-2">
@@ -55,16 +58,16 @@ export default function TablePreview({ tableName, metadata }: Props) {
         <div id={panelId} className="mt-3 rounded-2xl border border-[#e1c8aa] bg-[#fffaf1] p-3">
           <div className="mb-3 flex flex-wrap items-center justify-between gap-2 text-xs">
             <p className="font-semibold uppercase tracking-[0.12em] text-[#7c5433]">
-              Row count: {metadata.row_count ?? 'Unknown'}
+              Row count: {rowCount != null ? `${rowCount}${metadata.row_count_estimated ? ' (estimated)' : ''}` : 'Unknown'}
             </p>
             <p className="max-w-full truncate text-[#8b6a50]">
-              Columns: {columns.length ? columns.map((col) => col.name).join(', ') : 'Unavailable'}
+              Columns: {columnNames.length ? columnNames.join(', ') : 'Unavailable'}
             </p>
           </div>
           {sampleRows.length > 0 ? (
             <DataTable
               rows={sampleRows}
-              columns={columns.map((col) => col.name)}
+              columns={columnNames}
               compact
               maxHeight="16rem"
             />
@@ -76,3 +79,7 @@ export default function TablePreview({ tableName, metadata }: Props) {
     </div>
   );
 }
+
+// Memoized so page-level state changes do not re-render every table row;
+// only the preview whose metadata or open state changed updates.
+export default memo(TablePreview);
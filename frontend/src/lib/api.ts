@@ -4,8 +4,24 @@ let _authToken: string | null = null;
 let _onUnauthorized: ((message: string) => void) | null = null;
 let _refreshSession: (() => Promise<boolean>) | null = null;
 
+const HEALTH_CACHE_TTL_MS = 10_000;
+const DATABASES_CACHE_TTL_MS = 60_000;
+const SCHEMA_CACHE_TTL_MS = 300_000;
+const QUERIES_CACHE_TTL_MS = 60_000;
+const QUERY_DETAIL_CACHE_TTL_MS = 300_000;
+
+// Read-mostly catalog responses shared across pages. Entries hold the pending
+// promise so concurrent callers reuse one request.
+const _responseCache = new Map<string, { expiresAt: number; promise: Promise<unknown> }>();
+
+export function invalidateApiCache() {
+  _responseCache.clear();
+}
+
 export function setAuthToken(token: string | null) {
-  _authToken = token?.trim() || null;
+  const next = token?.trim() || null;
+  if (next !== _authToken) invalidateApiCache();
+  _authToken = next;
 }
 
 export function setUnauthorizedHandler(handler: ((message: string) => void) | null) {
@@ -49,6 +65,7 @@ async function request<T = unknown>(method: string, endpoint: string, opts?: {
   body?: unknown;
   formData?: FormData;
   retryOnAuthFailure?: boolean;
+  cacheTtlMs?: number;
 }): Promise<T> {
   let url = `${BASE_URL}${endpoint}`;
   if (opts?.params) {
@@ -57,6 +74,17 @@ async function request<T = unknown>(method: string, endpoint: string, opts?: {
     url += `?${qs}`;
   }
 
+  if (method === 'GET' && opts?.cacheTtlMs) {
+    const hit = _responseCache.get(url);
+    if (hit && hit.expiresAt > Date.now()) return hit.promise as Promise<T>;
+    const promise = request<T>(method, endpoint, { ...opts, cacheTtlMs: undefined });
+    _responseCache.set(url, { expiresAt: Date.now() + opts.cacheTtlMs, promise });
+    promise.catch(() => {
+      if (_responseCache.get(url)?.promise === promise) _responseCache.delete(url);
+    });
+    return promise;
+  }
+
   const headers: Record<string, string> = {};
   if (_authToken) headers['Authorization'] = `Bearer ${_authToken}`;
 
@@ -114,6 +142,7 @@ export interface TableInfo {
   columns: TableColumn[];
   sample_rows: Record<string, unknown>[];
   row_count: number | null;
+  row_count_estimated?: boolean;
 }
 
 export interface SchemaResponse {
@@ -212,35 +241,38 @@ export interface RefreshSessionResponse {
 }
 
 export const api = {
-  healthCheck: () => request<{ status: string }>('GET', '/health'),
+  healthCheck: () => request<{ status: string }>('GET', '/health', { cacheTtlMs: HEALTH_CACHE_TTL_MS }),
 
-  getDatabases: () => request<Database[]>('GET', '/databases/'),
+  getDatabases: () => request<Database[]>('GET', '/databases/', { cacheTtlMs: DATABASES_CACHE_TTL_MS }),
 
   getDatabaseSchema: (database: string, sampleRows = 5) =>
-    request<SchemaResponse>('GET', `/databases/${database}/schema`, { params: { sample_rows: sampleRows } }),
+    request<SchemaResponse>('GET', `/databases/${database}/schema`, {
+      params: { sample_rows: sampleRows },
+      cacheTtlMs: SCHEMA_CACHE_TTL_MS,
+    }),
 
   importDatabaseFromZip: (name: string, file: File) => {
     const fd = new FormData();
     fd.append('name', name);
     fd.append('file', file);
-    return request<{ name: string }>('POST', '/databases/import/zip', { formData: fd });
+    return request<{ name: string }>('POST', '/databases/import/zip', { formData: fd }).finally(invalidateApiCache);
   },
 
   importDatabaseFromSql: (name: string, file: File) => {
     const fd = new FormData();
     fd.append('name', name);
     fd.append('file', file);
-    return request<{ name: string }>('POST', '/databases/import/sql', { formData: fd });
+    return request<{ name: string }>('POST', '/databases/import/sql', { formData: fd }).finally(invalidateApiCache);
   },
 
   deleteDatabase: (database: string) =>
-    request('DELETE', `/databases/${database}`),
+    request('DELETE', `/databases/${database}`).finally(invalidateApiCache),
 
   getQueries: (database: string) =>
-    request<Query[]>('GET', `/databases/${database}/queries/`),
+    request<Query[]>('GET', `/databases/${database}/queries/`, { cacheTtlMs: QUERIES_CACHE_TTL_MS }),
 
   getQueryDetail: (database: string, queryId: string) =>
-    request<Query>('GET', `/databases/${database}/queries/${queryId}`),
+    request<Query>('GET', `/databases/${database}/queries/${queryId}`, { cacheTtlMs: QUERY_DETAIL_CACHE_TTL_MS }),
 
   getQueryMastery: (database: string) =>
     request<MasteryResponse>('GET', `/databases/${database}/queries/mastery`),
@@ -1,5 +1,5 @@
 import { useEffect, useId, useState, useCallback, useRef, type FormEvent } from 'react';
-import { api, type Database, type TableInfo } from '../lib/api';
+import { api, invalidateApiCache, type Database, type TableInfo } from '../lib/api';
 import StatusBadge from '../components/StatusBadge';
 import Collapsible from '../components/Collapsible';
 import TablePreview from '../components/TablePreview';
@@ -9,6 +9,17 @@ import { getWorkingDatabase, setWorkingDatabase } from '../lib/workingDatabase';
 const PROTECTED = new Set(['sales', 'university']);
 type WorkspaceMode = 'browse' | 'import';
 
+const shell = 'space-y-5 rounded-[28px] bg-[linear-gradient(180deg,rgba(246,245,253,0.72)_0%,rgba(244,246,252,0.84)_52%,rgba(247,250,249,0.9)_100%)] p-3 sm:p-4';
+const hero = 'rounded-[26px] border border-[#dde1f0] bg-[linear-gradient(135deg,#f5f4ff_0%,#eef2ff_52%,#eef7f4_100%)] p-6 text-[#3f4761] shadow-[0_14px_34px_rgba(123,128,173,0.1)]';
+const blockCard = 'rounded-[24px] border border-[#dfe2f0] bg-[rgba(255,255,255,0.82)] p-5 shadow-[0_12px_28px_rgba(123,128,173,0.08)]';
+const softCard = 'rounded-[20px] border border-[#e4e7f2] bg-[rgba(255,255,255,0.9)] p-5 shadow-[0_8px_22px_rgba(123,128,173,0.06)]';
+const sectionLabel = 'text-xs font-semibold uppercase tracking-[0.22em] text-[#615a96]';
+const sectionTitle = 'text-xl font-semibold text-[#3f4761]';
+const secondaryButton = 'app-secondary-btn';
+const primaryButton = 'app-primary-btn disabled:opacity-50';
+const textInput = 'app-input block w-full rounded-2xl bg-white/92 px-4 py-3 text-sm';
+const datasetButtonBase = 'flex w-full cursor-pointer items-center gap-3 rounded-2xl border px-3 py-3 text-left text-sm font-semibold transition-colors';
+
 export default function DatabaseManager() {
   const zipFileInputId = useId();
   const zipNameInputId = useId();
@@ -102,15 +113,20 @@ export default function DatabaseManager() {
     return message;
   }
 
-  async function handleZipImport(e: FormEvent<HTMLFormElement>) {
+  async function runImport(
+    e: FormEvent<HTMLFormElement>,
+    nameField: string,
+    fileInput: HTMLInputElement | null,
+    importer: (name: string, file: File) => Promise<{ name: string }>,
+  ) {
     e.preventDefault();
     const form = e.currentTarget;
-    const name = (form.elements.namedItem('zipName') as HTMLInputElement).value.trim();
-    const file = zipFileRef.current?.files?.[0];
+    const name = (form.elements.namedItem(nameField) as HTMLInputElement).value.trim();
+    const file = fileInput?.files?.[0];
     if (!file || !name) return;
     setDatasetActionMsg(null);
     try {
-      const result = await api.importDatabaseFromZip(name, file);
+      const result = await importer(name, file);
       setDatasetActionMsg({ type: 'success', text: `Successfully imported database: ${result.name}` });
       form.reset();
       setSelectedDb(result.name);
@@ -122,37 +138,15 @@ export default function DatabaseManager() {
     }
   }
 
-  async function handleSqlImport(e: FormEvent<HTMLFormElement>) {
-    e.preventDefault();
-    const form = e.currentTarget;
-    const name = (form.elements.namedItem('sqlName') as HTMLInputElement).value.trim();
-    const file = sqlFileRef.current?.files?.[0];
-    if (!file || !name) return;
-    setDatasetActionMsg(null);
-    try {
-      const result = await api.importDatabaseFromSql(name, file);
-      setDatasetActionMsg({ type: 'success', text: `Successfully imported database: ${result.name}` });
-      form.reset();
-      setSelectedDb(result.name);
-      setWorkingDatabase(result.name);
-      setMode('browse');
-      await loadDatabases();
-    } catch (e) {
-      setDatasetActionMsg({ type: 'error', text: `Import failed: ${formatImportError(e, name)}` });
-    }
+  function handleZipImport(e: FormEvent<HTMLFormElement>) {
+    return runImport(e, 'zipName', zipFileRef.current, api.importDatabaseFromZip);
+  }
+
+  function handleSqlImport(e: FormEvent<HTMLFormElement>) {
+    return runImport(e, 'sqlName', sqlFileRef.current, api.importDatabaseFromSql);
   }
 
   const selectedDbInfo = databases.find((db) => db.name === selectedDb);
-  const shell = 'space-y-5 rounded-[28px] bg-[linear-gradient(180deg,rgba(246,245,253,0.72)_0%,rgba(244,246,252,0.84)_52%,rgba(247,250,249,0.9)_100%)] p-3 sm:p-4';
-  const hero = 'rounded-[26px] border border-[#dde1f0] bg-[linear-gradient(135deg,#f5f4ff_0%,#eef2ff_52%,#eef7f4_100%)] p-6 text-[#3f4761] shadow-[0_14px_34px_rgba(123,128,173,0.1)]';
-  const blockCard = 'rounded-[24px] border border-[#dfe2f0] bg-[rgba(255,255,255,0.82)] p-5 shadow-[0_12px_28px_rgba(123,128,173,0.08)]';
-  const softCard = 'rounded-[20px] border border-[#e4e7f2] bg-[rgba(255,255,255,0.9)] p-5 shadow-[0_8px_22px_rgba(123,128,173,0.06)]';
-  const sectionLabel = 'text-xs font-semibold uppercase tracking-[0.22em] text-[#615a96]';
-  const sectionTitle = 'text-xl font-semibold text-[#3f4761]';
-  const secondaryButton = 'app-secondary-btn';
-  const primaryButton = 'app-primary-btn disabled:opacity-50';
-  const textInput = 'app-input block w-full rounded-2xl bg-white/92 px-4 py-3 text-sm';
-  const datasetButtonBase = 'flex w-full cursor-pointer items-center gap-3 rounded-2xl border px-3 py-3 text-left text-sm font-semibold transition-colors';
   const selectedDbProtected = !!selectedDbInfo?.is_default && PROTECTED.has(selectedDbInfo.name.toLowerCase());
   const selectedDbSharedStatus = selectedDbInfo?.is_default
     ? selectedDbProtected ? 'Yes; protected from deletion' : 'Yes'
@@ -191,7 +185,23 @@ export default function DatabaseManager() {
             </p>
           </div>
           <div className="rounded-[20px] border border-[#e4e7f2] bg-[rgba(255,255,255,0.82)] p-4 shadow-[0_8px_20px_rgba(123,128,173,0.06)]">
-            <label htmlFor="database-manager-select" className="mb-2 block text-sm font-semibold text-[#344054]">Database collection</label>
+            <div className="mb-2 flex items-center justify-between gap-3">
+              <label htmlFor="database-manager-select" className="block text-sm font-semibold text-[#344054]">Database collection</label>
+              <button
+                type="button"
+                onClick={() => {
+                  // The list is cached client-side; force a fresh fetch so
+                  // datasets added elsewhere show up without a reload.
+                  invalidateApiCache();
+                  void loadDatabases();
+                }}
+                disabled={loading}
+                className={`${secondaryButton} !rounded-xl !px-2.5 !py-1 text-xs`}
+              >
+                <RefreshCw className="h-3 w-3" />
+                Refresh
+              </button>
+            </div>
             <select
               id="database-manager-select"
               value={mode === 'browse' ? selectedDb : ''}
@@ -1,4 +1,4 @@
-import { useEffect, useId, useState, type FormEvent } from 'react';
+import { useEffect, useId, useMemo, useState, type FormEvent } from 'react';
 import { Link } from 'react-router-dom';
 import { api, type Database, type Query, type EvaluationResult, type TableInfo } from '../lib/api';
 import StatusBadge from '../components/StatusBadge';
@@ -270,6 +270,10 @@ export default function RAExercises() {
     setWalkthroughLoading(false);
   }, [selectedQueryId, selectedDb]);
 
+  // Looked up once per database list/selection change instead of on every
+  // keystroke-driven render of the page.
+  const selectedDbInfo = useMemo(() => databases.find((d) => d.name === selectedDb), [databases, selectedDb]);
+
   const filteredQueries = (() => {
     let qs = queries;
     if (selectedOps.size > 0) qs = qs.filter((q) => queryMatchesOps(q, selectedOps));
@@ -420,7 +424,6 @@ export default function RAExercises() {
     return <StatusBadge variant="error">Backend service connection failed</StatusBadge>;
   }
 
-  const selectedDbInfo = databases.find((d) => d.name === selectedDb);
   const blockCard = 'rounded-[24px] border border-[#dfe2f0] bg-[rgba(255,255,255,0.82)] p-5 shadow-[0_12px_28px_rgba(123,128,173,0.08)]';
   const blockCardSoft = 'rounded-[20px] border border-[#e4e7f2] bg-[rgba(255,255,255,0.9)] p-5 shadow-[0_8px_22px_rgba(123,128,173,0.06)]';
   const sectionLabel = 'text-xs font-semibold uppercase tracking-[0.22em] text-[#615a96]';
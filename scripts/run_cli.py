@@ -163,7 +163,7 @@ def _write_trace_html(trace, path: Path) -> None:
 </html>
 """
 
-    html = header + "\n" + "\n".join(rows_html) + "\n" + footer
+    html = "".join([header, "\n", "\n".join(rows_html), "\n", footer])
     path.write_text(html, encoding="utf-8")
 
 
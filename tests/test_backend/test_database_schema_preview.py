@@ -1,24 +1,50 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
 import pandas as pd
+import pytest
 
 from backend.services import datasets
 
 
-class _Location:
-    bucket = "bucket"
-    prefix = "prefix"
+class _Location(NamedTuple):
+    bucket: str = "bucket"
+    prefix: str = "prefix"
 
 
-def test_get_database_schema_reads_preview_rows_only(monkeypatch):
-    read_csv_nrows = []
+@dataclass
+class _FakeStorage:
+    listing: Dict[str, str] = field(default_factory=lambda: {"students.csv": "etag-v1"})
+    content: bytes = b"id,name\n1,A\n2,B\n3,C\n"
+    total_size: Optional[int] = None
+    downloads: List[Tuple[str, int]] = field(default_factory=list)
+
+    def list_object_etags(self, _bucket, _prefix):
+        return dict(self.listing)
 
-    def fake_resolve_location(_database, _user_id):
-        return _Location()
+    def download_object_range(self, _bucket, object_path, length):
+        self.downloads.append((object_path, length))
+        return self.content[:length], self.total_size
 
-    def fake_list_objects(_bucket, _prefix):
-        return ["students.csv"]
 
-    def fake_download_object(_bucket, _object_path):
-        return b"id,name\n1,A\n2,B\n3,C\n"
+@pytest.fixture
+def patched_datasets(monkeypatch):
+    storage = _FakeStorage()
+    datasets.clear_schema_preview_cache()
+    monkeypatch.setattr(
+        datasets, "_resolve_location", lambda _database, _user_id: _Location()
+    )
+    monkeypatch.setattr(datasets, "storage_list_object_etags", storage.list_object_etags)
+    monkeypatch.setattr(
+        datasets, "storage_download_object_range", storage.download_object_range
+    )
+    yield storage
+    datasets.clear_schema_preview_cache()
+
+
+def test_get_database_schema_reads_preview_rows_only(monkeypatch, patched_datasets):
+    read_csv_nrows = []
 
     def fake_read_csv(_raw, *args, **kwargs):
         # Capture the contract we care about: preview reads must be bounded.
@@ -27,59 +53,233 @@ def test_get_database_schema_reads_preview_rows_only(monkeypatch):
             return pd.DataFrame({"id": [1, 2], "name": ["A", "B"]})
         return pd.DataFrame({"id": [1, 2, 3], "name": ["A", "B", "C"]})
 
-    monkeypatch.setattr(datasets, "_resolve_location", fake_resolve_location)
-    monkeypatch.setattr(datasets, "storage_list_objects", fake_list_objects)
-    monkeypatch.setattr(datasets, "storage_download_object", fake_download_object)
-    monkeypatch.setattr(pd, "read_csv", fake_read_csv)
+    monkeypatch.setattr(datasets, "_read_csv", fake_read_csv)
 
     schema = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
 
     assert schema.name == "TestDB"
     assert schema.tables[0].name == "students"
     assert read_csv_nrows == [2]
+    assert [length for _path, length in patched_datasets.downloads] == [65536]
+
+
+def test_get_database_schema_preview_sample_size_respected(patched_datasets):
+    schema = datasets.get_database_schema("TestDB", sample_rows=1, user_id="u1")
+
+    assert len(schema.tables[0].sample_rows) == 1
+    assert schema.tables[0].row_count == 3
+    assert schema.tables[0].row_count_estimated is False
+
 
+def test_get_database_schema_reads_prefix_of_large_objects(patched_datasets):
+    row = b"1,Ada\n"
+    patched_datasets.content = b"id,name\n" + row * 20_000
+    patched_datasets.total_size = 6 * 1024**3
+
+    schema = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+
+    table = schema.tables[0]
+    assert max(length for _path, length in patched_datasets.downloads) <= 65536
+    assert table.sample_rows == [{"id": 1, "name": "Ada"}, {"id": 1, "name": "Ada"}]
+    expected_rows = (patched_datasets.total_size - len(b"id,name\n")) / len(row)
+    assert abs(table.row_count - expected_rows) / expected_rows < 0.001
+    assert table.row_count_estimated is True
 
-def test_get_database_schema_preview_sample_size_respected(monkeypatch):
-    def fake_resolve_location(_database, _user_id):
-        return _Location()
 
-    def fake_list_objects(_bucket, _prefix):
-        return ["students.csv"]
+def test_get_database_schema_downloads_whole_object_when_prefix_has_no_full_row(
+    monkeypatch, patched_datasets
+):
+    wide = b"id,body\n1," + b"x" * 100_000 + b"\n"
+    patched_datasets.content = wide
+    patched_datasets.total_size = len(wide)
+    full_downloads = []
 
-    def fake_download_object(_bucket, _object_path):
-        return b"id,name\n1,A\n2,B\n3,C\n"
+    def fake_download_object(_bucket, object_path):
+        full_downloads.append(object_path)
+        return wide
 
-    monkeypatch.setattr(datasets, "_resolve_location", fake_resolve_location)
-    monkeypatch.setattr(datasets, "storage_list_objects", fake_list_objects)
     monkeypatch.setattr(datasets, "storage_download_object", fake_download_object)
 
     schema = datasets.get_database_schema("TestDB", sample_rows=1, user_id="u1")
 
-    assert len(schema.tables[0].sample_rows) == 1
+    table = schema.tables[0]
+    assert full_downloads == ["prefix/students.csv"]
+    assert table.row_count == 1
+    assert table.row_count_estimated is False
+    assert table.sample_rows[0]["id"] == 1
+
+
+def test_get_database_schema_downloads_whole_object_when_prefix_splits_quoted_field(
+    monkeypatch, patched_datasets
+):
+    note = b'"' + b"line\n" * 20_000 + b'"'
+    whole = b"id,note\n1," + note + b"\n2,short\n"
+    patched_datasets.content = whole
+    patched_datasets.total_size = len(whole)
+    full_downloads = []
+
+    def fake_download_object(_bucket, object_path):
+        full_downloads.append(object_path)
+        return whole
+
+    monkeypatch.setattr(datasets, "storage_download_object", fake_download_object)
+
+    schema = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+
+    table = schema.tables[0]
+    assert full_downloads == ["prefix/students.csv"]
+    assert [row["id"] for row in table.sample_rows] == [1, 2]
+    assert table.row_count == 2
+    assert table.row_count_estimated is False
+
+
+def test_get_database_schema_uses_cache(patched_datasets):
+    datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+    datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+
+    assert len(patched_datasets.downloads) == 1
+
+
+def test_get_database_schema_cache_skips_parse(monkeypatch, patched_datasets):
+    read_calls = {"count": 0}
+    real_read_csv = pd.read_csv
 
+    def counting_read_csv(*args, **kwargs):
+        read_calls["count"] += 1
+        return real_read_csv(*args, **kwargs)
 
-def test_get_database_schema_uses_cache(monkeypatch):
-    download_calls = {"count": 0}
+    monkeypatch.setattr(datasets, "_read_csv", counting_read_csv)
 
-    def fake_resolve_location(_database, _user_id):
-        return _Location()
+    first = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+    second = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
 
-    def fake_list_objects(_bucket, _prefix):
-        return ["students.csv"]
+    assert read_calls["count"] == 1
+    assert second is first
 
-    def fake_download_object(_bucket, _object_path):
-        download_calls["count"] += 1
-        return b"id,name\n1,A\n2,B\n"
 
+def test_prefetch_warms_cache(patched_datasets):
+    prefetched = datasets.prefetch_schema("TestDB", sample_rows=2, user_id="u1").result()
+    schema = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+
+    assert schema is prefetched
+    assert len(patched_datasets.downloads) == 1
+
+
+def test_clear_during_prefetch_discards_stale_preview(monkeypatch, patched_datasets):
+    started = threading.Event()
+    release = threading.Event()
+    download = patched_datasets.download_object_range
+    patched_datasets.content = b"id,name\n1,OLD\n"
+
+    def blocking_download(bucket, object_path, length):
+        result = download(bucket, object_path, length)
+        started.set()
+        assert release.wait(timeout=5)
+        return result
+
+    monkeypatch.setattr(datasets, "storage_download_object_range", blocking_download)
+
+    future = datasets.prefetch_schema("DbX", sample_rows=1, user_id="u1")
+    assert started.wait(timeout=5)
+    datasets.clear_schema_preview_cache("DbX")
+    patched_datasets.content = b"id,name\n1,NEW\n"
+    release.set()
+    future.result(timeout=5)
+
+    schema = datasets.get_database_schema("DbX", sample_rows=1, user_id="u1")
+
+    assert schema.tables[0].sample_rows == [{"id": 1, "name": "NEW"}]
+
+
+def test_clear_schema_preview_cache_keeps_other_databases(patched_datasets):
+    datasets.get_database_schema("DbA", sample_rows=1, user_id="u1")
+    datasets.get_database_schema("DbB", sample_rows=1, user_id="u1")
+    datasets.clear_schema_preview_cache("DbA")
+
+    assert "DbA" not in datasets._SCHEMA_PREVIEW_CACHE
+    datasets.get_database_schema("DbB", sample_rows=1, user_id="u1")
+    assert len(patched_datasets.downloads) == 2
+
+
+def test_schema_preview_cache_evicts_least_recently_used(monkeypatch, patched_datasets):
+    monkeypatch.setattr(datasets, "_SCHEMA_PREVIEW_MAX_ENTRIES", 4)
+
+    first = datasets.get_database_schema("Db0", sample_rows=1, user_id="u1")
+    for index in range(1, 10):
+        datasets.get_database_schema(f"Db{index}", sample_rows=1, user_id="u1")
+        # Keep Db0 recently used so it survives eviction.
+        assert datasets.get_database_schema("Db0", sample_rows=1, user_id="u1") is first
+
+    cached = [
+        (db, entry) for db, shard in datasets._SCHEMA_PREVIEW_CACHE.items() for entry in shard
+    ]
+    assert len(cached) == 4
+    assert [db for db, _entry in cached] == ["Db7", "Db8", "Db9", "Db0"]
+
+
+def test_schema_preview_cache_stays_bounded_under_concurrent_access(monkeypatch):
+    monkeypatch.setattr(datasets, "_SCHEMA_PREVIEW_MAX_ENTRIES", 8)
     datasets.clear_schema_preview_cache()
-    monkeypatch.setattr(datasets, "_resolve_location", fake_resolve_location)
-    monkeypatch.setattr(datasets, "storage_list_objects", fake_list_objects)
-    monkeypatch.setattr(datasets, "storage_download_object", fake_download_object)
+    generation = datasets._schema_preview_generation
+    schema = datasets.DatabaseSchema(name="Db", tables=[])
+    errors = []
+
+    def worker(offset):
+        try:
+            for index in range(300):
+                key = ("u1", f"Db{(offset + index) % 12}", index % 3)
+                datasets._store_schema_preview(key, schema, generation(key[1]))
+                datasets._cached_schema_preview(key)
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    shards = datasets._SCHEMA_PREVIEW_CACHE.values()
+    assert sum(len(shard) for shard in shards) == 8
+    assert all(shards)
+    datasets.clear_schema_preview_cache()
+
+
+def test_get_database_schema_uses_disk_cache(monkeypatch, tmp_path, patched_datasets):
+    monkeypatch.setenv("RA_SCHEMA_CACHE_DIR", str(tmp_path))
+
+    first = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+    datasets._SCHEMA_PREVIEW_CACHE.clear()
+    second = datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
 
+    assert len(patched_datasets.downloads) == 1
+    assert second == first
+    assert list(tmp_path.rglob("*.tmp")) == []
+
+    # A re-uploaded object gets a new ETag, which invalidates the disk entry.
+    patched_datasets.listing["students.csv"] = "etag-v2"
+    datasets._SCHEMA_PREVIEW_CACHE.clear()
     datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+    assert len(patched_datasets.downloads) == 2
+
+    datasets.clear_schema_preview_cache("TestDB")
     datasets.get_database_schema("TestDB", sample_rows=2, user_id="u1")
+    assert len(patched_datasets.downloads) == 3
 
-    assert download_calls["count"] == 1
+
+def test_get_database_schema_returns_tables_sorted_by_name(patched_datasets):
+    patched_datasets.listing = {"takes.csv": "t1", "course.csv": "c1", "student.csv": "s1"}
+    patched_datasets.content = b"id\n1\n"
+
+    schema = datasets.get_database_schema("TestDB", sample_rows=1, user_id="u1")
+
+    assert [table.name for table in schema.tables] == ["course", "student", "takes"]
+    assert sorted(path for path, _length in patched_datasets.downloads) == [
+        "prefix/course.csv",
+        "prefix/student.csv",
+        "prefix/takes.csv",
+    ]
 
 
 def test_bundled_default_schema_uses_local_files(monkeypatch, tmp_path):
@@ -94,14 +294,14 @@ def test_bundled_default_schema_uses_local_files(monkeypatch, tmp_path):
     monkeypatch.setenv("RA_BUNDLED_DEFAULT_DATASETS", "LocalDefault")
     monkeypatch.setattr(
         datasets,
-        "storage_download_object",
+        "storage_download_object_range",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(
             AssertionError("storage should not be used")
         ),
     )
     monkeypatch.setattr(
         datasets,
-        "storage_list_objects",
+        "storage_list_object_etags",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(
             AssertionError("storage should not be used")
         ),
@@ -185,3 +385,15 @@ def test_bundled_default_catalog_uses_local_files(monkeypatch, tmp_path):
 
     assert raw == b'{"questions": []}'
     datasets.clear_dataset_metadata_cache()
+
+
+def test_get_database_schema_truncates_long_preview_cells(patched_datasets):
+    long_text = "x" * 500
+    patched_datasets.listing = {"notes.csv": "etag-v1"}
+    patched_datasets.content = f"id,body\n1,{long_text}\n".encode("utf-8")
+
+    schema = datasets.get_database_schema("TestDB", sample_rows=1, user_id="u1")
+
+    body = schema.tables[0].sample_rows[0]["body"]
+    assert len(body) == datasets._PREVIEW_CELL_MAX_CHARS + 1
+    assert body.endswith("…")
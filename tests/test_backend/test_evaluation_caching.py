@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 
 from backend.services import datasets, sql as sql_service
@@ -35,6 +37,33 @@ def test_load_database_env_uses_cache(monkeypatch):
     assert second["students"].loc[0, "name"] == "A"
 
 
+def test_local_relation_cache_rereads_when_csv_changes(tmp_path, monkeypatch):
+    csv_path = tmp_path / "Students.csv"
+    csv_path.write_text("ID,Name\n1,A\n")
+    read_calls = {"count": 0}
+    real_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        read_calls["count"] += 1
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(datasets, "_read_csv", counting_read_csv)
+
+    first = datasets._load_local_relation_dataframe(csv_path, "students")
+    second = datasets._load_local_relation_dataframe(csv_path, "students")
+    assert read_calls["count"] == 1
+    assert second is first
+
+    csv_path.write_text("ID,Name\n1,A\n2,B\n")
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = datasets._load_local_relation_dataframe(csv_path, "students")
+
+    assert read_calls["count"] == 2
+    assert third["name"].tolist() == ["A", "B"]
+    assert third["_prov"].tolist() == [[("students", 0)], [("students", 1)]]
+
+
 def test_evaluate_sql_reuses_cached_sqlite_snapshot(monkeypatch):
     build_calls = {"count": 0}
 
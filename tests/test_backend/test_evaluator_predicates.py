@@ -0,0 +1,243 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.core import evaluator, stepper
+
+
+def _load_university_env():
+    root = Path(__file__).resolve().parents[2] / "datasets" / "University"
+    env = {}
+    for csv_path in root.glob("*.csv"):
+        relation = csv_path.stem.lower()
+        df = pd.read_csv(csv_path).copy()
+        df.columns = [c.lower() for c in df.columns]
+        df["_prov"] = [[(relation, int(i))] for i in range(len(df))]
+        env[relation] = df
+    return env
+
+
+def _row_loop_filter(monkeypatch, df, cond, aliases):
+    monkeypatch.setattr(evaluator, "_cond_mask", lambda cond, df, aliases: None)
+    return evaluator._filter_rows(df, cond, aliases)
+
+
+@pytest.mark.parametrize(
+    "cond",
+    [
+        "a = 2",
+        "a > 1 AND b <> 'z'",
+        "NOT a = 2 OR b = 'x'",
+        "1 < a < 3",
+        "a IS NULL",
+        "b IS NOT NULL AND a + 1 >= 3",
+        "t.a != 3",
+    ],
+)
+def test_column_mask_matches_row_evaluation(monkeypatch, cond):
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, None], "b": ["x", "y", "z", None], "_prov": [[]] * 4}
+    )
+    aliases = {"t": ["a", "b"]}
+
+    mask = evaluator._cond_mask(cond, df, aliases)
+
+    assert mask is not None
+    expected = _row_loop_filter(monkeypatch, df, cond, aliases)
+    pd.testing.assert_frame_equal(df[mask.to_numpy()].reset_index(drop=True), expected)
+
+
+def test_column_mask_declines_predicates_without_column_semantics():
+    df = pd.DataFrame({"a": [1, 2], "_prov": [[], []]})
+
+    assert evaluator._cond_mask("a", df, {}) is None
+    assert evaluator._cond_mask("a = 1 OR missing", df, {}) is None
+    assert evaluator._cond_mask("a / 0 > 1", df, {}) is None
+
+
+def test_theta_join_matches_row_by_row_filtering(monkeypatch):
+    env = _load_university_env()
+    cond = "st.id = adv.s_id AND st.tot_cred > 50"
+    ast = stepper.parse(f"rho st(student) ⋈{{{cond}}} rho adv(advisor)")
+
+    result = evaluator.eval(ast, env, [])
+
+    product = evaluator.eval(stepper.parse("rho st(student) x rho adv(advisor)"), env, [])
+    expected = _row_loop_filter(monkeypatch, product, cond, product.attrs["aliases"])
+    visible = [c for c in expected.columns if c != "_prov"]
+    assert result[visible].to_dict(orient="records") == expected[visible].to_dict(orient="records")
+    assert result["_prov"].tolist() == expected["_prov"].tolist()
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "rho st(student) ⋈{st.id = adv.s_id} rho adv(advisor)",
+        "rho a(student) ⋈{a.dept_name = b.dept_name AND a.id <> b.id} rho b(student)",
+        "section ⋈{section.building = classroom.building AND section.room_number = classroom.room_number} classroom",
+    ],
+)
+def test_equi_theta_join_matches_filtered_product(monkeypatch, expression):
+    ast = stepper.parse(expression)
+    hashed = evaluator.eval(ast, _load_university_env(), [])
+
+    monkeypatch.setattr(evaluator, "_equi_join_keys", lambda L, R, cond: [])
+    filtered = evaluator.eval(ast, _load_university_env(), [])
+
+    assert len(hashed) > 0
+    pd.testing.assert_frame_equal(hashed, filtered)
+    assert hashed.attrs == filtered.attrs
+
+
+def test_equi_theta_join_does_not_match_null_keys():
+    left = pd.DataFrame({"a": [1.0, None], "_prov": [[("l", 0)], [("l", 1)]]})
+    right = pd.DataFrame({"b": [None, 1.0], "_prov": [[("r", 0)], [("r", 1)]]})
+
+    result = evaluator._theta_join(left, right, "a = b")
+
+    assert result[["a", "b"]].to_dict(orient="records") == [{"a": 1.0, "b": 1.0}]
+    assert result["_prov"].tolist() == [[("l", 0), ("r", 1)]]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "sigma{dept_name = 'Comp. Sci.' AND tot_cred >= 50}(student)",
+        "sigma{NOT (salary < 70000 OR dept_name = 'Finance')}(instructor)",
+        "sigma{s1.dept_name = s2.dept_name AND s1.id != s2.id}(rho s1(student) x rho s2(student))",
+    ],
+)
+def test_selection_mask_matches_row_loop(monkeypatch, expression):
+    ast = stepper.parse(expression)
+    vectorized = evaluator.eval(ast, _load_university_env(), [])
+
+    monkeypatch.setattr(evaluator, "_cond_mask", lambda cond, df, aliases: None)
+    looped = evaluator.eval(ast, _load_university_env(), [])
+
+    assert len(vectorized) > 0
+    pd.testing.assert_frame_equal(vectorized, looped)
+
+
+def test_row_slots_bind_bare_and_alias_qualified_names():
+    product = evaluator.eval(
+        stepper.parse("rho s1(student) x rho s2(student)"), _load_university_env(), []
+    )
+    aliases = product.attrs["aliases"]
+    slots = evaluator._row_slots(list(product.columns), aliases)
+
+    for values, (_, row) in zip(
+        product.head(3).itertuples(index=False, name=None), product.head(3).iterrows()
+    ):
+        bound = {key: values[i] for key, i in slots.items()}
+        assert bound["id"] == row["id"]
+        assert bound["id_r"] == row["id_r"]
+        assert bound["s1.id"] == row["id"]
+        assert bound["s2.id"] == row["id_r"]
+        assert bound["s2.id_r"] == row["id_r"]
+        assert all(not key.startswith("_prov") for key in bound)
+
+
+def test_evaluation_leaves_env_frames_untouched():
+    env = _load_university_env()
+    before = {name: df.copy(deep=True) for name, df in env.items()}
+
+    evaluator.eval(stepper.parse("sigma{tot_cred > 50}(rho s(student)) ⋈ advisor"), env, [])
+
+    for name, df in env.items():
+        pd.testing.assert_frame_equal(df, before[name])
+        assert "aliases" not in df.attrs
+
+
+def test_projection_unions_provenance_of_duplicate_rows():
+    df = pd.DataFrame(
+        {
+            "a": [None, 1, None, 2, 1],
+            "b": ["x", "y", "x", "z", "w"],
+            "_prov": [[("t", i)] for i in range(5)],
+        }
+    )
+
+    out = evaluator._project_distinct(df, ["a"])
+
+    assert out["a"].tolist()[1:] == [1, 2]
+    assert pd.isna(out["a"].iloc[0])
+    assert out["_prov"].tolist() == [
+        [("t", 0), ("t", 2)],
+        [("t", 1), ("t", 4)],
+        [("t", 3)],
+    ]
+
+
+@pytest.mark.parametrize("right_ids", [[2, 4], [2.0, 4.0]])
+def test_difference_keeps_provenance_of_surviving_rows(right_ids):
+    left = pd.DataFrame(
+        {"id": [1, 2, 3, 4, 5], "_prov": [[("l", i)] for i in range(5)]}
+    )
+    right = pd.DataFrame(
+        {"id": right_ids, "_prov": [[("r", i)] for i in range(len(right_ids))]}
+    )
+
+    out = evaluator._difference(left, right)
+
+    assert out["id"].tolist() == [1, 3, 5]
+    assert out["_prov"].tolist() == [[("l", 0)], [("l", 2)], [("l", 4)]]
+
+
+def test_difference_confirms_hash_matches_by_value(monkeypatch):
+    left = pd.DataFrame({"id": [1, 2, 3], "_prov": [[("l", i)] for i in range(3)]})
+    right = pd.DataFrame({"id": [2, 7], "_prov": [[("r", i)] for i in range(2)]})
+    # Every row collides, so only the value check can tell them apart.
+    monkeypatch.setattr(
+        evaluator, "_row_hashes", lambda df: pd.Series(0, index=df.index, dtype="uint64")
+    )
+
+    out = evaluator._difference(left, right)
+
+    assert out["id"].tolist() == [1, 3]
+    assert out["_prov"].tolist() == [[("l", 0)], [("l", 2)]]
+
+
+def test_theta_join_in_morsels_matches_single_pass(monkeypatch):
+    ast = stepper.parse("rho a(instructor) ⋈{a.salary > b.salary} rho b(instructor)")
+    whole = evaluator.eval(ast, _load_university_env(), [])
+
+    monkeypatch.setattr(evaluator, "_THETA_MORSEL_ROWS", 7)
+    morsels = evaluator.eval(ast, _load_university_env(), [])
+
+    assert len(whole) > 0
+    pd.testing.assert_frame_equal(morsels, whole)
+    assert morsels.attrs == whole.attrs
+
+
+@pytest.mark.parametrize(
+    "dtype, left_values, right_values, expected",
+    [
+        (float, [1.0, 0.0, None], [-0.0, 1.0, 2.0], [1.0, 0.0, None, 2.0]),
+        (object, [1, "1"], ["1", 2], [1, "1", 2]),
+    ],
+)
+def test_union_drops_rows_equal_to_earlier_ones(dtype, left_values, right_values, expected):
+    left = pd.DataFrame({"v": pd.Series(left_values, dtype=dtype)})
+    right = pd.DataFrame({"v": pd.Series(right_values, dtype=dtype)})
+    left["_prov"] = [[("l", i)] for i in range(len(left))]
+    right["_prov"] = [[("r", i)] for i in range(len(right))]
+
+    out = evaluator._union(left, right)
+
+    assert out["v"].equals(pd.Series(expected, dtype=dtype, name="v"))
+    assert out["_prov"].tolist()[: len(left)] == left["_prov"].tolist()
+
+
+def test_union_confirms_hash_matches_by_value(monkeypatch):
+    left = pd.DataFrame({"id": [1, 2], "_prov": [[("l", 0)], [("l", 1)]]})
+    right = pd.DataFrame({"id": [3, 1], "_prov": [[("r", 0)], [("r", 1)]]})
+    # Every row collides, so only the value check can tell them apart.
+    monkeypatch.setattr(
+        evaluator, "_row_hashes", lambda df: pd.Series(0, index=df.index, dtype="uint64")
+    )
+
+    out = evaluator._union(left, right)
+
+    assert out["id"].tolist() == [1, 2, 3]
+    assert out["_prov"].tolist() == [[("l", 0)], [("l", 1)], [("r", 0)]]
@@ -17,3 +17,9 @@ def test_parse_error_lists_user_facing_natural_join_aliases():
     assert "For natural join, use ⋈, natural_join, natjoin, or njoin; aliases are case-insensitive." in message
     assert "* JOIN" not in message
     assert "Expected one of: JOIN" not in message
+
+
+def test_repeated_invalid_expression_still_raises_parse_error():
+    for _ in range(2):
+        with pytest.raises(ParseError):
+            evaluate_expression("pi{name}(instructor join teaches)", "University")
@@ -0,0 +1,27 @@
+import urllib.request
+from email.message import Message
+
+from backend.services import supabase
+
+
+class _SetCookieResponse:
+    def __init__(self, cookie):
+        self._headers = Message()
+        self._headers["Set-Cookie"] = cookie
+
+    def info(self):
+        return self._headers
+
+
+def test_http_session_does_not_keep_cookies_between_requests():
+    supabase._http_session.cache_clear()
+    try:
+        session = supabase._http_session()
+        request = urllib.request.Request("https://example.supabase.co/auth/v1/token")
+        session.cookies.extract_cookies(
+            _SetCookieResponse("sb-refresh=user-a; Path=/"), request
+        )
+
+        assert len(session.cookies) == 0
+    finally:
+        supabase._http_session.cache_clear()
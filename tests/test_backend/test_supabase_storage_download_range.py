@@ -0,0 +1,56 @@
+from backend.services import supabase
+
+
+class _Response:
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+def _patch(monkeypatch, response, full_downloads):
+    def fake_request_raw(method, url, **kwargs):
+        assert method == "GET"
+        assert kwargs["headers"]["Range"] == "bytes=0-3"
+        return response
+
+    def fake_download_object(bucket, object_path):
+        full_downloads.append((bucket, object_path))
+        return b"id\n1\n2\n"
+
+    monkeypatch.setattr(supabase, "_supabase_url", lambda: "https://example.supabase.co")
+    monkeypatch.setattr(supabase, "_service_headers", lambda: {"apikey": "k"})
+    monkeypatch.setattr(supabase, "_request_raw", fake_request_raw)
+    monkeypatch.setattr(supabase, "storage_download_object", fake_download_object)
+
+
+def test_storage_download_object_range_reports_total_size(monkeypatch):
+    full_downloads = []
+    response = _Response(206, b"id\n1", {"Content-Range": "bytes 0-3/7"})
+    _patch(monkeypatch, response, full_downloads)
+
+    assert supabase.storage_download_object_range("bucket", "db/t.csv", 4) == (b"id\n1", 7)
+    assert full_downloads == []
+
+
+def test_storage_download_object_range_full_body_has_no_size(monkeypatch):
+    full_downloads = []
+    _patch(monkeypatch, _Response(200, b"id\n1\n2\n"), full_downloads)
+
+    assert supabase.storage_download_object_range("bucket", "db/t.csv", 4) == (
+        b"id\n1\n2\n",
+        None,
+    )
+    assert full_downloads == []
+
+
+def test_storage_download_object_range_unknown_size_downloads_whole_object(monkeypatch):
+    full_downloads = []
+    response = _Response(206, b"id\n1", {"Content-Range": "bytes 0-3/*"})
+    _patch(monkeypatch, response, full_downloads)
+
+    assert supabase.storage_download_object_range("bucket", "db/t.csv", 4) == (
+        b"id\n1\n2\n",
+        None,
+    )
+    assert full_downloads == [("bucket", "db/t.csv")]